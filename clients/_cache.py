@@ -0,0 +1,279 @@
+"""
+Small time-based caches for the REST clients.
+
+TTLCache keeps values in a process-local dict, FileCache persists JSON-able
+values under a directory and expires them by file mtime. ttl_cached wires
+both around a plain function (cache_methods does the same per instance),
+swr_cached serves stale values while a background thread refreshes them. single_flight collapses concurrent calls
+with the same arguments onto one in-flight call.
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """In-memory cache whose entries expire `ttl` seconds after being set."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._d = {}
+        self._sweep_at = 64  # size at which set() next drops expired entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._d.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._d.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        if len(self._d) >= self._sweep_at:
+            # keys that are never read again would otherwise stay forever
+            self._d = {k: entry for k, entry in self._d.items() if entry[0] > now}
+            self._sweep_at = max(64, 2 * len(self._d))
+        self._d[key] = (now + self.ttl, value)
+
+    def clear(self) -> None:
+        self._d.clear()
+
+    def __len__(self) -> int:
+        return len(self._d)
+
+
+class FileCache:
+    """JSON files on disk, one per key, considered fresh while younger than `ttl` seconds."""
+
+    def __init__(self, directory: str, ttl: float):
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, key: tuple) -> str:
+        name = "_".join(str(part) for part in key)
+        name = re.sub(r"[^A-Za-z0-9_.=-]", "-", name)
+        return os.path.join(self.directory, f"{name}.json")
+
+    def get(self, key: tuple, default: Any = None) -> Any:
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl:
+                return default
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return default
+
+    def set(self, key: tuple, value: Any) -> None:
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not write cache file {path}: {e}")
+
+
+def ttl_cached(ttl: float, disk_dir: Optional[str] = None) -> Callable:
+    """
+    Cache a function's results for `ttl` seconds, keyed by its arguments.
+
+    With `disk_dir` set, results are also written to JSON files there so a
+    restarted process can reuse them. `None` results are never cached, so
+    error fallbacks are retried on the next call. Coroutine functions are
+    supported; the awaited result is what gets cached.
+    """
+    def decorator(fn: Callable) -> Callable:
+        memory = TTLCache(ttl)
+        disk = FileCache(disk_dir, ttl) if disk_dir else None
+
+        def lookup(key):
+            value = memory.get(key, _MISSING)
+            if value is _MISSING and disk is not None:
+                value = disk.get((fn.__name__,) + key, _MISSING)
+                if value is not _MISSING:
+                    memory.set(key, value)
+            return value
+
+        def store(key, value):
+            if value is not None:
+                memory.set(key, value)
+                if disk is not None:
+                    disk.set((fn.__name__,) + key, value)
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                key = args + tuple(sorted(kwargs.items()))
+                value = lookup(key)
+                if value is _MISSING:
+                    value = await fn(*args, **kwargs)
+                    store(key, value)
+                return value
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                key = args + tuple(sorted(kwargs.items()))
+                value = lookup(key)
+                if value is _MISSING:
+                    value = fn(*args, **kwargs)
+                    store(key, value)
+                return value
+
+        wrapper.cache = memory
+        wrapper.cache_clear = memory.clear
+        return wrapper
+
+    return decorator
+
+
+def swr_cached(ttl: float, stale: float) -> Callable:
+    """
+    Stale-while-revalidate cache for plain functions, keyed by their arguments.
+
+    Results younger than `ttl` seconds are returned as is. Results younger
+    than `stale` seconds are returned too, but also trigger one background
+    thread that calls the function again and replaces the entry. Older (or
+    missing) results are fetched inline. Return `None` from the function to
+    signal a failed fetch: it is never cached, and the previous value (if
+    any) stays in place and is what callers get back.
+    """
+    def decorator(fn: Callable) -> Callable:
+        entries = {}  # key -> (monotonic fetch time, value)
+        refreshing = set()
+        lock = threading.Lock()
+
+        def fetch(key, args, kwargs):
+            value = fn(*args, **kwargs)
+            if value is not None:
+                with lock:
+                    entries[key] = (time.monotonic(), value)
+            return value
+
+        def refresh(key, args, kwargs):
+            try:
+                fetch(key, args, kwargs)
+            except Exception as e:
+                logger.warning(f"Background refresh of {fn.__name__} failed: {e}")
+            finally:
+                with lock:
+                    refreshing.discard(key)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items()))
+            with lock:
+                entry = entries.get(key)
+                age = time.monotonic() - entry[0] if entry is not None else None
+                if age is not None and age >= ttl and age < stale and key not in refreshing:
+                    refreshing.add(key)
+                    threading.Thread(target=refresh, args=(key, args, kwargs), daemon=True).start()
+            if age is not None and age < stale:
+                return entry[1]
+            value = fetch(key, args, kwargs)
+            if value is None and entry is not None:
+                return entry[1]
+            return value
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def cache_methods(instance: Any, ttls: Dict[str, float]) -> None:
+    """
+    Wrap each named method of `instance` in its own ttl_cached cache.
+
+    Call it from __init__ instead of decorating the methods in the class
+    body: the cache then lives on the instance, its keys leave out `self`,
+    and it is dropped together with the instance.
+    """
+    for name, ttl in ttls.items():
+        setattr(instance, name, ttl_cached(ttl)(getattr(instance, name)))
+
+
+class SingleFlight:
+    """Share one in-flight asyncio task between concurrent callers for the same key."""
+
+    def __init__(self):
+        self._inflight = {}
+
+    async def do(self, key: Hashable, coro_fn: Callable) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield so one caller being cancelled doesn't cancel the call for the others
+        return await asyncio.shield(task)
+
+
+def single_flight(fn: Callable) -> Callable:
+    """
+    Collapse concurrent calls with the same arguments into one call.
+
+    Works on coroutine functions (callers on the loop share a task) and on
+    plain functions (callers on other threads wait for the first thread's
+    result). Put it under ttl_cached or swr_cached: the cache absorbs
+    sequential repeats, single_flight absorbs the concurrent misses.
+    """
+    if inspect.iscoroutinefunction(fn):
+        flight = SingleFlight()
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items()))
+            return await flight.do(key, lambda: fn(*args, **kwargs))
+
+        return async_wrapper
+
+    inflight = {}
+    lock = threading.Lock()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = args + tuple(sorted(kwargs.items()))
+        with lock:
+            future = inflight.get(key)
+            owner = future is None
+            if owner:
+                future = inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = fn(*args, **kwargs)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with lock:
+                inflight.pop(key, None)
+
+    return wrapper
@@ -0,0 +1,124 @@
+"""
+Request-weight limiter for the Binance futures REST API.
+
+Binance counts request weight per IP per calendar minute and reports the
+running total in the X-MBX-USED-WEIGHT-1m response header. WeightLimiter
+tracks that budget locally, syncs it from the header on every response and
+makes callers wait for the next minute instead of running into 429s/418 bans.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Mapping, Optional
+
+import requests
+
+from config.settings import HTTP_USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+USED_WEIGHT_HEADER = "X-MBX-USED-WEIGHT-1m"
+
+
+def klines_weight(limit: int) -> int:
+    """Request weight of /fapi/v1/klines for a given `limit`."""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+class WeightLimiter:
+    """
+    Per-minute request-weight budget shared by every client on this process.
+
+    Callers `acquire()` (or `acquire_async()`) the weight of a request before
+    sending it and pass the response headers to `update()` afterwards.
+    Requests are held back once `headroom` of the limit is used, leaving the
+    rest for other processes on the same IP.
+    """
+
+    def __init__(self, limit: int = 2400, headroom: float = 0.9):
+        self.limit = limit
+        self.budget = int(limit * headroom)
+        self._lock = threading.Lock()
+        self._minute = int(time.time() // 60)
+        self._used = 0
+        self._blocked_until = 0.0
+
+    def _reserve(self, weight: int) -> float:
+        """Reserve `weight` if it fits, else return how long to wait before retrying."""
+        with self._lock:
+            now = time.time()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+
+            minute = int(now // 60)
+            if minute != self._minute:
+                self._minute = minute
+                self._used = 0
+
+            if self._used + weight <= self.budget:
+                self._used += weight
+                return 0.0
+            return 60 - (now % 60)
+
+    def acquire(self, weight: int = 1) -> None:
+        """Block the calling thread until `weight` fits in the current minute."""
+        while True:
+            wait = self._reserve(weight)
+            if not wait:
+                return
+            logger.warning(f"Binance weight budget exhausted ({self._used}/{self.limit}) - waiting {wait:.1f}s")
+            time.sleep(wait)
+
+    async def acquire_async(self, weight: int = 1) -> None:
+        """Wait on the event loop until `weight` fits in the current minute."""
+        while True:
+            wait = self._reserve(weight)
+            if not wait:
+                return
+            logger.warning(f"Binance weight budget exhausted ({self._used}/{self.limit}) - waiting {wait:.1f}s")
+            await asyncio.sleep(wait)
+
+    def update(self, headers: Mapping[str, str], status: Optional[int] = None) -> None:
+        """Sync the local count from a response's weight header and honour 429/418 Retry-After."""
+        used = headers.get(USED_WEIGHT_HEADER)
+        with self._lock:
+            if used is not None:
+                minute = int(time.time() // 60)
+                if minute != self._minute:
+                    self._minute = minute
+                    self._used = 0
+                # the server also counts other processes; local reservations cover in-flight requests
+                self._used = max(self._used, int(used))
+
+            if status in (418, 429):
+                retry_after = float(headers.get("Retry-After") or 60)
+                self._blocked_until = max(self._blocked_until, time.time() + retry_after)
+                logger.warning(f"Binance returned {status} - pausing requests for {retry_after:.0f}s")
+
+
+class RateLimitedSession(requests.Session):
+    """requests.Session that acquires weight from a WeightLimiter around every request."""
+
+    def __init__(self, limiter: WeightLimiter):
+        super().__init__()
+        self.limiter = limiter
+        # keep-alive and gzip/deflate are requests defaults; pin them with the app's agent
+        self.headers.update({"User-Agent": HTTP_USER_AGENT, "Connection": "keep-alive"})
+
+    def request(self, method, url, *args, weight: int = 1, **kwargs):
+        self.limiter.acquire(weight)
+        response = super().request(method, url, *args, **kwargs)
+        self.limiter.update(response.headers, response.status_code)
+        return response
+
+
+# One budget per IP: every futures REST client in the process shares it
+BINANCE_FUTURES_LIMITER = WeightLimiter(limit=2400)
@@ -1,36 +1,114 @@
-import requests
-import pandas as pd
+import numpy as np
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from clients._cache import ttl_cached, single_flight
+from clients._ratelimit import RateLimitedSession, BINANCE_FUTURES_LIMITER, klines_weight
 
 FUTURES_OPEN_INTEREST = "https://fapi.binance.com/fapi/v1/openInterest"
 FUTURES_FUNDING_RATE = "https://fapi.binance.com/fapi/v1/fundingRate"
+FUTURES_PREMIUM_INDEX = "https://fapi.binance.com/fapi/v1/premiumIndex"
 KLINES = "https://fapi.binance.com/fapi/v1/klines"
 
+# one pooled keep-alive session for every call in this module, sharing the IP weight budget
+_SESSION = RateLimitedSession(BINANCE_FUTURES_LIMITER)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+@ttl_cached(ttl=5)
 def get_open_interest(symbol: str) -> float:
-    r = requests.get(FUTURES_OPEN_INTEREST, params={"symbol": symbol}, timeout=5).json()
+    r = orjson.loads(_SESSION.get(FUTURES_OPEN_INTEREST, params={"symbol": symbol}, timeout=5).content)
     return float(r.get("openInterest", 0.0))
 
+@ttl_cached(ttl=60)
 def get_latest_funding_rate(symbol: str) -> float:
     # get most recent funding rate
-    r = requests.get(FUTURES_FUNDING_RATE, params={"symbol": symbol, "limit": 1}, timeout=5).json()
+    r = orjson.loads(_SESSION.get(FUTURES_FUNDING_RATE, params={"symbol": symbol, "limit": 1}, timeout=5).content)
     if isinstance(r, list) and r:
         return float(r[0].get("fundingRate", 0.0))
     return 0.0
 
+@ttl_cached(ttl=60)
+def get_all_funding_rates() -> dict:
+    """
+    Latest funding rate for every perpetual in one request.
+    Returns { symbol: funding_rate }.
+    """
+    response = _SESSION.get(FUTURES_PREMIUM_INDEX, timeout=10, weight=10)
+    response.raise_for_status()
+    r = orjson.loads(response.content)
+    if not isinstance(r, list):
+        raise ValueError(f"Unexpected premiumIndex response: {r}")
+    return {d["symbol"]: float(d.get("lastFundingRate") or 0.0) for d in r}
+
+@ttl_cached(ttl=60)  # the newest 1h candle is still forming, so keep its close at most a minute old
+@single_flight
+def _fetch_closes(symbol: str, interval: str = "1h", limit: int = 168) -> list:
+    params = {"symbol": symbol, "interval": interval, "limit": limit}
+    data = orjson.loads(_SESSION.get(KLINES, params=params, timeout=5, weight=klines_weight(limit)).content)
+    return [float(candle[4]) for candle in data]
+
+def _abs_pearson_many(sym_closes: list, btc_closes: list) -> list:
+    """
+    |Pearson| between each symbol's 1h log returns and BTC's, rounded to 2 places.
+    Every series is right-aligned on the latest candle and stacked into one matrix,
+    so all correlations come out of the same few array ops; a shorter history just
+    masks its leading columns. Fewer than 3 overlapping closes gives 0.0.
+    """
+    k, m = len(sym_closes), len(btc_closes)
+    if m < 3:
+        return [0.0] * k
+    s = np.ones((k, m), dtype=np.float64)  # log(1) = 0 keeps the padding finite
+    n = np.empty(k, dtype=np.int64)
+    for i, closes in enumerate(sym_closes):
+        tail = closes[-m:] if closes else []
+        n[i] = len(tail)
+        if n[i]:
+            s[i, m - n[i]:] = tail
+
+    # log returns turn the division into a subtraction; Pearson is then row-wise dot products
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s_ret = np.diff(np.log(s), axis=1)
+        b_ret = np.diff(np.log(np.asarray(btc_closes, dtype=np.float64)))
+        mask = np.arange(m - 1) >= (m - n)[:, None]
+        count = mask.sum(axis=1)
+        b_ret = np.where(mask, b_ret, 0.0)
+        s_ret = np.where(mask, s_ret - (np.where(mask, s_ret, 0.0).sum(axis=1) / count)[:, None], 0.0)
+        b_ret = np.where(mask, b_ret - (b_ret.sum(axis=1) / count)[:, None], 0.0)
+        denom = np.sqrt((s_ret * s_ret).sum(axis=1) * (b_ret * b_ret).sum(axis=1))
+        corr = (s_ret * b_ret).sum(axis=1) / denom
+    corr = np.where((denom > 0) & np.isfinite(corr) & (n >= 3), np.abs(corr), 0.0)
+    return [round(float(c), 2) for c in corr]
+
 def get_btc_correlation(symbol: str) -> float:
     """
-    Compute Pearson correlation (abs) between 1h returns of symbol and BTCUSDT
+    Compute Pearson correlation (abs) between 1h log returns of symbol and BTCUSDT
     over the last 168 candles.
     """
-    def fetch_close(sym):
-        params = {"symbol": sym, "interval": "1h", "limit": 168}
-        data = requests.get(KLINES, params=params, timeout=5).json()
-        return [float(candle[4]) for candle in data]
-
-    sym_closes = fetch_close(symbol)
-    btc_closes = fetch_close("BTCUSDT")
-    if len(sym_closes) < 2 or len(btc_closes) < 2:
-        return 0.0
-    s_ret = pd.Series(sym_closes).pct_change().dropna()
-    b_ret = pd.Series(btc_closes).pct_change().dropna()
-    corr = s_ret.corr(b_ret)
-    return round(abs(corr) if corr is not None else 0.0, 2) 
\ No newline at end of file
+    # the two kline requests are independent - run them side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        sym_future = pool.submit(_fetch_closes, symbol)
+        btc_future = pool.submit(_fetch_closes, "BTCUSDT")
+        sym_closes = sym_future.result()
+        btc_closes = btc_future.result()
+
+    return _abs_pearson_many([sym_closes], btc_closes)[0]
+
+def get_btc_correlations(symbols: list, max_workers: int = 16) -> list:
+    """
+    get_btc_correlation for many symbols. BTC's closes are fetched once and
+    shared, the symbols' closes are fetched concurrently, and every correlation
+    comes out of one _abs_pearson_many call. Results follow `symbols` order.
+    """
+    if not symbols:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols) + 1)) as pool:
+        btc_future = pool.submit(_fetch_closes, "BTCUSDT")
+        sym_closes = list(pool.map(_fetch_closes, symbols))
+        btc_closes = btc_future.result()
+    return _abs_pearson_many(sym_closes, btc_closes)
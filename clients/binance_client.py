@@ -1,28 +1,108 @@
 import asyncio
-import json
+import orjson
 import logging
+import random
 import time
+from collections import namedtuple
+from operator import itemgetter
+import numpy as np
 from typing import Dict, List, Optional, Callable
 import websockets
-import requests
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 
+from clients._cache import cache_methods, single_flight
+from clients._ratelimit import RateLimitedSession, BINANCE_FUTURES_LIMITER, klines_weight
+from utils.helpers import drain_queue
+
 from config.settings import (
     BINANCE_API_KEY, BINANCE_API_SECRET, BINANCE_REST_URL,
-    BINANCE_WS_URL, CANDLE_INTERVALS, WS_RECONNECT_DELAY
+    BINANCE_WS_URL, CANDLE_INTERVALS, WS_RECONNECT_DELAY,
+    WS_HEARTBEAT_INTERVAL, WS_QUEUE_SIZE, WS_DISPATCH_BATCH,
+    WS_PING_INTERVAL, WS_PING_TIMEOUT, WS_MAX_MESSAGE_SIZE, WS_MAX_QUEUE,
+    WS_RECONNECT_MAX_DELAY, WS_BREAKER_FAILURES, WS_BREAKER_WINDOW, WS_BREAKER_COOLDOWN,
+    HTTP_USER_AGENT
 )
 
 logger = logging.getLogger(__name__)
 
+# Field name and dtype for each column of a Binance kline row
+KLINE_FIELDS = [
+    ("timestamp", np.int64),
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.float64),
+    ("close_time", np.int64),
+    ("quote_volume", np.float64),
+    ("trades", np.int64),
+    ("taker_buy_volume", np.float64),
+    ("taker_buy_quote_volume", np.float64),
+]
+
+# One candle; fields in the same order as KLINE_FIELDS
+Kline = namedtuple("Kline", [field for field, _ in KLINE_FIELDS])
+
+# Output name, Binance field and fallback field for each float in a 24h ticker
+# (futures tickers have no bid/ask or prevClose, so those fall back)
+TICKER_FLOAT_FIELDS = [
+    ("price_change", "priceChange", None),
+    ("price_change_percent", "priceChangePercent", None),
+    ("weighted_avg_price", "weightedAvgPrice", None),
+    ("prev_close_price", "prevClosePrice", "openPrice"),
+    ("last_price", "lastPrice", None),
+    ("last_qty", "lastQty", None),
+    ("bid_price", "bidPrice", "lastPrice"),
+    ("ask_price", "askPrice", "lastPrice"),
+    ("open_price", "openPrice", None),
+    ("high_price", "highPrice", None),
+    ("low_price", "lowPrice", None),
+    ("volume", "volume", None),
+    ("quote_volume", "quoteVolume", None),
+]
+
+# Short keys of a 24hrTicker stream event and the REST ticker field each carries
+TICKER_STREAM_FIELDS = {
+    "s": "symbol", "p": "priceChange", "P": "priceChangePercent", "w": "weightedAvgPrice",
+    "c": "lastPrice", "Q": "lastQty", "o": "openPrice", "h": "highPrice", "l": "lowPrice",
+    "v": "volume", "q": "quoteVolume", "O": "openTime", "C": "closeTime", "n": "count",
+}
+_get_stream_fields = itemgetter(*TICKER_STREAM_FIELDS)
+
+# Request weight of /ticker/24hr without a symbol (a single-symbol call weighs 1)
+ALL_TICKERS_WEIGHT = 40
+
 class BinanceDataClient:
     """Comprehensive Binance data client for REST API and WebSocket streams."""
     
+    # REST methods cached per instance, with their TTLs in seconds
+    _CACHED_METHODS = {
+        "get_24h_ticker": 5,
+        "get_open_interest": 5,
+        "get_funding_rate": 60,
+        "get_all_24h_tickers": 5,
+        "get_all_funding_rates": 60,
+    }
+    
     def __init__(self):
         self.client = None
         self.ws_connections = {}
         self.callbacks = {}
         self.is_running = False
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Pooled keep-alive session for the sync REST methods, gated by the shared weight budget
+        self._http_session = RateLimitedSession(BINANCE_FUTURES_LIMITER)
+        self._http_session.mount("https://", HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        cache_methods(self, self._CACHED_METHODS)
         
         if BINANCE_API_KEY and BINANCE_API_SECRET:
             self.client = Client(BINANCE_API_KEY, BINANCE_API_SECRET)
@@ -33,7 +113,8 @@ class BinanceDataClient:
     def get_perpetual_symbols(self) -> List[str]:
         """Get all available perpetual contract symbols."""
         try:
-            exchange_info = requests.get(f"{BINANCE_REST_URL}/fapi/v1/exchangeInfo", timeout=10).json()
+            response = self._http_session.get(f"{BINANCE_REST_URL}/fapi/v1/exchangeInfo", timeout=10)
+            exchange_info = orjson.loads(response.content)
             symbols = [
                 s["symbol"] for s in exchange_info["symbols"]
                 if s["contractType"] == "PERPETUAL" and s["status"] == "TRADING"
@@ -44,7 +125,103 @@ class BinanceDataClient:
             logger.error(f"Error fetching perpetual symbols: {e}")
             return []
     
-    def get_klines(self, symbol: str, interval: str, limit: int = 500) -> List[Dict]:
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared aiohttp session used by the async REST methods."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=5),
+                headers={"User-Agent": HTTP_USER_AGENT}
+            )
+        return self._session
+    
+    async def _get_json_async(self, path: str, params: Optional[Dict] = None, weight: int = 1):
+        """GET a Binance REST endpoint on the shared session and return the parsed JSON."""
+        session = await self._ensure_session()
+        await BINANCE_FUTURES_LIMITER.acquire_async(weight)
+        async with session.get(f"{BINANCE_REST_URL}{path}", params=params) as response:
+            BINANCE_FUTURES_LIMITER.update(response.headers, response.status)
+            response.raise_for_status()
+            return orjson.loads(await response.read())
+    
+    @staticmethod
+    def _klines_to_columns(klines: List[List]) -> Dict[str, np.ndarray]:
+        """Convert raw Binance kline rows into one NumPy array per field."""
+        if not klines:
+            return {field: np.empty(0, dtype=dtype) for field, dtype in KLINE_FIELDS}
+        
+        # Binance sends prices as strings and times as ints; NumPy parses the whole block at once
+        arr = np.asarray(klines, dtype=object)[:, :len(KLINE_FIELDS)]
+        return {field: arr[:, i].astype(dtype) for i, (field, dtype) in enumerate(KLINE_FIELDS)}
+    
+    @classmethod
+    def _format_klines(cls, klines: List[List]) -> List[Kline]:
+        """Convert raw Binance kline rows into Kline tuples."""
+        columns = cls._klines_to_columns(klines)
+        return list(map(Kline._make, zip(*(col.tolist() for col in columns.values()))))
+    
+    @staticmethod
+    def _format_tickers(rows: List[Dict]) -> List[Dict]:
+        """Convert raw 24h ticker payloads into the client's ticker dicts."""
+        if not rows:
+            return []
+        
+        # Gather every numeric string into one block so NumPy parses them in a single call
+        raw = [
+            [row.get(src, row.get(fallback)) for _, src, fallback in TICKER_FLOAT_FIELDS]
+            for row in rows
+        ]
+        values = np.asarray(raw, dtype=object).astype(np.float64).tolist()
+        names = [name for name, _, _ in TICKER_FLOAT_FIELDS]
+        
+        return [
+            {
+                "symbol": row["symbol"],
+                **dict(zip(names, parsed)),
+                "open_time": row["openTime"],
+                "close_time": row["closeTime"],
+                "count": row["count"]
+            }
+            for row, parsed in zip(rows, values)
+        ]
+    
+    @classmethod
+    def _format_stream_tickers(cls, events: List[Dict]) -> List[Dict]:
+        """Convert 24hrTicker stream events into the same dicts as the REST tickers."""
+        rest_names = TICKER_STREAM_FIELDS.values()
+        return cls._format_tickers([dict(zip(rest_names, _get_stream_fields(event))) for event in events])
+    
+    @classmethod
+    def _format_ticker(cls, data: Dict) -> Dict:
+        """Convert a raw 24h ticker payload into the client's ticker dict."""
+        return cls._format_tickers([data])[0]
+    
+    @staticmethod
+    def _format_open_interest(data: Dict) -> Dict:
+        """Convert a raw open interest payload into the client's dict."""
+        return {
+            "symbol": data["symbol"],
+            "open_interest": float(data["openInterest"]),
+            "timestamp": data["time"]
+        }
+    
+    @staticmethod
+    def _format_funding_rate(data) -> Optional[Dict]:
+        """Convert a raw funding rate payload (a list from Binance) into the client's dict."""
+        # Handle list response from Binance API
+        if isinstance(data, list) and data:
+            data = data[0]  # Get the first (most recent) funding rate
+        else:
+            return None
+        
+        return {
+            "symbol": data["symbol"],
+            "funding_rate": float(data["fundingRate"]),
+            "funding_time": data["fundingTime"],
+            "next_funding_time": data.get("nextFundingTime", 0)
+        }
+    
+    def get_klines(self, symbol: str, interval: str, limit: int = 500) -> List[Kline]:
         """Fetch kline/candlestick data for a symbol."""
         try:
             params = {
@@ -52,60 +229,40 @@ class BinanceDataClient:
                 "interval": interval,
                 "limit": limit
             }
-            response = requests.get(f"{BINANCE_REST_URL}/fapi/v1/klines", params=params, timeout=5)
+            response = self._http_session.get(f"{BINANCE_REST_URL}/fapi/v1/klines", params=params, timeout=5, weight=klines_weight(limit))
             response.raise_for_status()
             
-            klines = response.json()
-            formatted_klines = []
+            return self._format_klines(orjson.loads(response.content))
             
-            for kline in klines:
-                formatted_klines.append({
-                    "timestamp": kline[0],
-                    "open": float(kline[1]),
-                    "high": float(kline[2]),
-                    "low": float(kline[3]),
-                    "close": float(kline[4]),
-                    "volume": float(kline[5]),
-                    "close_time": kline[6],
-                    "quote_volume": float(kline[7]),
-                    "trades": int(kline[8]),
-                    "taker_buy_volume": float(kline[9]),
-                    "taker_buy_quote_volume": float(kline[10])
-                })
+        except Exception as e:
+            logger.error(f"Error fetching klines for {symbol}: {e}")
+            return []
+    
+    def get_klines_columns(self, symbol: str, interval: str, limit: int = 500) -> Dict[str, np.ndarray]:
+        """Fetch klines for a symbol as one NumPy array per field (timestamp, open, ..., close)."""
+        try:
+            params = {
+                "symbol": symbol,
+                "interval": interval,
+                "limit": limit
+            }
+            response = self._http_session.get(f"{BINANCE_REST_URL}/fapi/v1/klines", params=params, timeout=5, weight=klines_weight(limit))
+            response.raise_for_status()
             
-            return formatted_klines
+            return self._klines_to_columns(orjson.loads(response.content))
             
         except Exception as e:
             logger.error(f"Error fetching klines for {symbol}: {e}")
-            return []
+            return self._klines_to_columns([])
     
     def get_24h_ticker(self, symbol: str) -> Optional[Dict]:
         """Get 24-hour ticker statistics for a symbol."""
         try:
             params = {"symbol": symbol}
-            response = requests.get(f"{BINANCE_REST_URL}/fapi/v1/ticker/24hr", params=params, timeout=5)
+            response = self._http_session.get(f"{BINANCE_REST_URL}/fapi/v1/ticker/24hr", params=params, timeout=5)
             response.raise_for_status()
             
-            data = response.json()
-            return {
-                "symbol": data["symbol"],
-                "price_change": float(data["priceChange"]),
-                "price_change_percent": float(data["priceChangePercent"]),
-                "weighted_avg_price": float(data["weightedAvgPrice"]),
-                "prev_close_price": float(data.get("prevClosePrice", data["openPrice"])),
-                "last_price": float(data["lastPrice"]),
-                "last_qty": float(data["lastQty"]),
-                "bid_price": float(data.get("bidPrice", data["lastPrice"])),
-                "ask_price": float(data.get("askPrice", data["lastPrice"])),
-                "open_price": float(data["openPrice"]),
-                "high_price": float(data["highPrice"]),
-                "low_price": float(data["lowPrice"]),
-                "volume": float(data["volume"]),
-                "quote_volume": float(data["quoteVolume"]),
-                "open_time": data["openTime"],
-                "close_time": data["closeTime"],
-                "count": data["count"]
-            }
+            return self._format_ticker(orjson.loads(response.content))
             
         except Exception as e:
             logger.error(f"Error fetching 24h ticker for {symbol}: {e}")
@@ -115,15 +272,10 @@ class BinanceDataClient:
         """Get open interest for a symbol."""
         try:
             params = {"symbol": symbol}
-            response = requests.get(f"{BINANCE_REST_URL}/fapi/v1/openInterest", params=params, timeout=5)
+            response = self._http_session.get(f"{BINANCE_REST_URL}/fapi/v1/openInterest", params=params, timeout=5)
             response.raise_for_status()
             
-            data = response.json()
-            return {
-                "symbol": data["symbol"],
-                "open_interest": float(data["openInterest"]),
-                "timestamp": data["time"]
-            }
+            return self._format_open_interest(orjson.loads(response.content))
             
         except Exception as e:
             logger.error(f"Error fetching open interest for {symbol}: {e}")
@@ -133,105 +285,300 @@ class BinanceDataClient:
         """Get current funding rate for a symbol."""
         try:
             params = {"symbol": symbol, "limit": 1}
-            response = requests.get(f"{BINANCE_REST_URL}/fapi/v1/fundingRate", params=params, timeout=5)
+            response = self._http_session.get(f"{BINANCE_REST_URL}/fapi/v1/fundingRate", params=params, timeout=5)
+            response.raise_for_status()
+            
+            return self._format_funding_rate(orjson.loads(response.content))
+            
+        except Exception as e:
+            logger.error(f"Error fetching funding rate for {symbol}: {e}")
+            return None
+    
+    def get_all_24h_tickers(self) -> Dict[str, Dict]:
+        """Get 24-hour ticker statistics for every symbol in a single request."""
+        try:
+            response = self._http_session.get(f"{BINANCE_REST_URL}/fapi/v1/ticker/24hr", timeout=10, weight=ALL_TICKERS_WEIGHT)
+            response.raise_for_status()
+            
+            return {t["symbol"]: t for t in self._format_tickers(orjson.loads(response.content))}
+            
+        except Exception as e:
+            logger.error(f"Error fetching bulk 24h tickers: {e}")
+            return {}
+    
+    def get_all_funding_rates(self) -> Dict[str, Dict]:
+        """Get current funding rate and mark price for every symbol in a single request."""
+        try:
+            response = self._http_session.get(f"{BINANCE_REST_URL}/fapi/v1/premiumIndex", timeout=10, weight=10)
             response.raise_for_status()
             
-            data = response.json()
-            # Handle list response from Binance API
-            if isinstance(data, list) and data:
-                data = data[0]  # Get the first (most recent) funding rate
-            else:
-                return None
-                
             return {
-                "symbol": data["symbol"],
-                "funding_rate": float(data["fundingRate"]),
-                "funding_time": data["fundingTime"],
-                "next_funding_time": data.get("nextFundingTime", 0)
+                d["symbol"]: {
+                    "symbol": d["symbol"],
+                    "funding_rate": float(d["lastFundingRate"] or 0),
+                    "funding_time": d["time"],
+                    "next_funding_time": d.get("nextFundingTime", 0),
+                    "mark_price": float(d["markPrice"])
+                }
+                for d in orjson.loads(response.content)
             }
             
+        except Exception as e:
+            logger.error(f"Error fetching bulk funding rates: {e}")
+            return {}
+    
+    @single_flight
+    async def get_klines_async(self, symbol: str, interval: str, limit: int = 500) -> List[Kline]:
+        """Async variant of get_klines using the shared aiohttp session."""
+        try:
+            params = {"symbol": symbol, "interval": interval, "limit": limit}
+            return self._format_klines(await self._get_json_async("/fapi/v1/klines", params, weight=klines_weight(limit)))
+        except Exception as e:
+            logger.error(f"Error fetching klines for {symbol}: {e}")
+            return []
+    
+    @single_flight
+    async def get_24h_ticker_async(self, symbol: str) -> Optional[Dict]:
+        """Async variant of get_24h_ticker using the shared aiohttp session."""
+        try:
+            return self._format_ticker(await self._get_json_async("/fapi/v1/ticker/24hr", {"symbol": symbol}))
+        except Exception as e:
+            logger.error(f"Error fetching 24h ticker for {symbol}: {e}")
+            return None
+    
+    @single_flight
+    async def get_open_interest_async(self, symbol: str) -> Optional[Dict]:
+        """Async variant of get_open_interest using the shared aiohttp session."""
+        try:
+            return self._format_open_interest(await self._get_json_async("/fapi/v1/openInterest", {"symbol": symbol}))
+        except Exception as e:
+            logger.error(f"Error fetching open interest for {symbol}: {e}")
+            return None
+    
+    @single_flight
+    async def get_funding_rate_async(self, symbol: str) -> Optional[Dict]:
+        """Async variant of get_funding_rate using the shared aiohttp session."""
+        try:
+            params = {"symbol": symbol, "limit": 1}
+            return self._format_funding_rate(await self._get_json_async("/fapi/v1/fundingRate", params))
         except Exception as e:
             logger.error(f"Error fetching funding rate for {symbol}: {e}")
             return None
     
-    async def subscribe_ticker_stream(self, symbols: List[str], callback: Callable):
-        """Subscribe to real-time ticker streams for multiple symbols."""
-        if not symbols:
-            return
+    async def get_klines_bulk(self, symbols: List[str], interval: str, limit: int = 500) -> Dict[str, List[Kline]]:
+        """Fetch klines for many symbols concurrently. Returns {symbol: klines}."""
+        results = await asyncio.gather(*[self.get_klines_async(s, interval, limit) for s in symbols])
+        return dict(zip(symbols, results))
+    
+    async def get_24h_ticker_bulk(self, symbols: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch 24h tickers for many symbols. Returns {symbol: ticker}.
+        Once the per-symbol requests would weigh as much as the all-market one,
+        a single /ticker/24hr call replaces them.
+        """
+        if len(symbols) >= ALL_TICKERS_WEIGHT:
+            try:
+                rows = await self._get_json_async("/fapi/v1/ticker/24hr", weight=ALL_TICKERS_WEIGHT)
+                tickers = {t["symbol"]: t for t in self._format_tickers(rows)}
+                return {s: tickers.get(s) for s in symbols}
+            except Exception as e:
+                logger.error(f"Error fetching bulk 24h tickers: {e}")
+                return dict.fromkeys(symbols)
+        results = await asyncio.gather(*[self.get_24h_ticker_async(s) for s in symbols])
+        return dict(zip(symbols, results))
+    
+    async def get_open_interest_bulk(self, symbols: List[str], concurrency: int = 30) -> Dict[str, Optional[Dict]]:
+        """Fetch open interest for many symbols concurrently. Returns {symbol: open_interest}."""
+        semaphore = asyncio.Semaphore(concurrency)
         
-        # Binance WebSocket has a limit of 200 streams per connection
-        chunk_size = 200
-        symbol_chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+        async def fetch(symbol: str):
+            async with semaphore:
+                return await self.get_open_interest_async(symbol)
         
-        for i, chunk in enumerate(symbol_chunks):
-            stream_name = f"ticker_chunk_{i}"
-            await self._subscribe_stream(chunk, "ticker", stream_name, callback)
+        results = await asyncio.gather(*[fetch(s) for s in symbols])
+        return dict(zip(symbols, results))
+    
+    async def get_funding_rate_bulk(self, symbols: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch funding rates for many symbols concurrently. Returns {symbol: funding_rate}."""
+        results = await asyncio.gather(*[self.get_funding_rate_async(s) for s in symbols])
+        return dict(zip(symbols, results))
+    
+    async def close(self):
+        """Close the shared aiohttp session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def subscribe_ticker_stream(self, symbols: List[str], callback: Callable):
+        """Subscribe to real-time ticker streams for multiple symbols."""
+        streams = [f"{symbol.lower()}@ticker" for symbol in symbols]
+        await self._subscribe_chunked(streams, "ticker", {"ticker": callback})
     
     async def subscribe_kline_stream(self, symbols: List[str], interval: str, callback: Callable):
         """Subscribe to real-time kline streams for multiple symbols."""
-        if not symbols:
+        streams = [f"{symbol.lower()}@kline_{interval}" for symbol in symbols]
+        await self._subscribe_chunked(streams, f"kline_{interval}", {"kline": callback})
+    
+    async def _subscribe_chunked(self, streams: List[str], name: str, callbacks: Dict[str, Callable]):
+        """Open one combined-stream connection per 200 streams."""
+        if not streams:
             return
         
+        # Binance WebSocket has a limit of 200 streams per connection
         chunk_size = 200
-        symbol_chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+        stream_chunks = [streams[i:i + chunk_size] for i in range(0, len(streams), chunk_size)]
         
-        for i, chunk in enumerate(symbol_chunks):
-            stream_name = f"kline_{interval}_chunk_{i}"
-            await self._subscribe_stream(chunk, f"kline_{interval}", stream_name, callback)
+        for i, chunk in enumerate(stream_chunks):
+            await self._subscribe_stream(chunk, f"{name}_chunk_{i}", callbacks)
     
-    async def _subscribe_stream(self, symbols: List[str], stream_type: str, connection_name: str, callback: Callable):
-        """Subscribe to a specific stream type for given symbols."""
-        streams = [f"{symbol.lower()}@{stream_type}" for symbol in symbols]
+    async def _subscribe_stream(self, streams: List[str], connection_name: str, callbacks: Dict[str, Callable]):
+        """
+        Subscribe to a combined stream connection.
+        
+        Streams of different types can share one connection; each message is
+        dispatched on the type in its `stream` field ("ticker", "kline", ...).
+        """
         stream_url = f"{BINANCE_WS_URL}/stream?streams={'/'.join(streams)}"
         
-        self.callbacks[connection_name] = callback
+        self.callbacks[connection_name] = callbacks
         
-        async def websocket_handler():
-            while self.is_running:
-                try:
-                    async with websockets.connect(stream_url) as websocket:
-                        logger.info(f"Connected to {stream_type} stream for {len(symbols)} symbols")
+        async def dispatch_worker(queue: asyncio.Queue):
+            # Parse and hand off messages so a slow callback never stalls recv();
+            # each wake-up takes every message already queued instead of just one.
+            # One worker per connection keeps each symbol's updates in arrival order.
+            while True:
+                for message in await drain_queue(queue, WS_DISPATCH_BATCH):
+                    try:
+                        data = orjson.loads(message)
                         
-                        while self.is_running:
-                            try:
-                                message = await websocket.recv()
-                                data = json.loads(message)
+                        if 'data' in data:
+                            # "btcusdt@kline_1m" -> "kline"
+                            stream_type = data.get('stream', '').split('@', 1)[-1].split('_', 1)[0]
+                            callback = callbacks.get(stream_type)
+                            if callback:
+                                await callback(data['data'])
+                            
+                    except Exception as e:
+                        logger.error(f"Error processing WebSocket message: {e}")
+        
+        async def websocket_handler():
+            queue = asyncio.Queue(maxsize=WS_QUEUE_SIZE)
+            worker = asyncio.create_task(dispatch_worker(queue))
+            dropped = 0
+            last_depth_log = time.monotonic()
+            delay = WS_RECONNECT_DELAY
+            failures = []  # monotonic times of recent connection failures
+            
+            # Stagger the initial connects so chunk connections don't move in lockstep
+            await asyncio.sleep(random.random() * 0.5)
+            
+            try:
+                while self.is_running:
+                    try:
+                        async with websockets.connect(
+                            stream_url,
+                            compression="deflate",
+                            max_size=WS_MAX_MESSAGE_SIZE,
+                            max_queue=WS_MAX_QUEUE,
+                            ping_interval=WS_PING_INTERVAL,
+                            ping_timeout=WS_PING_TIMEOUT
+                        ) as websocket:
+                            logger.info(f"Connected to {connection_name} ({len(streams)} streams)")
+                            delay = WS_RECONNECT_DELAY
+                            failures.clear()
+                            
+                            while self.is_running:
+                                try:
+                                    message = await websocket.recv()
+                                except websockets.exceptions.ConnectionClosed:
+                                    logger.warning(f"WebSocket connection closed for {connection_name}")
+                                    break
                                 
-                                if 'data' in data:
-                                    await callback(data['data'])
-                                    
-                            except websockets.exceptions.ConnectionClosed:
-                                logger.warning(f"WebSocket connection closed for {connection_name}")
-                                break
-                            except Exception as e:
-                                logger.error(f"Error processing WebSocket message: {e}")
+                                # Drop the oldest message rather than block the socket reader
+                                if queue.full():
+                                    queue.get_nowait()
+                                    dropped += 1
+                                queue.put_nowait(message)
                                 
-                except Exception as e:
-                    logger.error(f"WebSocket connection error for {connection_name}: {e}")
-                
-                if self.is_running:
-                    logger.info(f"Reconnecting to {connection_name} in {WS_RECONNECT_DELAY} seconds...")
-                    await asyncio.sleep(WS_RECONNECT_DELAY)
+                                now = time.monotonic()
+                                if now - last_depth_log >= WS_HEARTBEAT_INTERVAL:
+                                    logger.info(f"{connection_name} queue depth {queue.qsize()}/{WS_QUEUE_SIZE}, dropped {dropped}")
+                                    last_depth_log = now
+                                    
+                    except Exception as e:
+                        logger.error(f"WebSocket connection error for {connection_name}: {e}")
+                        now = time.monotonic()
+                        failures = [t for t in failures if now - t < WS_BREAKER_WINDOW]
+                        failures.append(now)
+                        # Decorrelated jitter: spread retries out and grow them while failures continue
+                        delay = min(WS_RECONNECT_MAX_DELAY, random.uniform(WS_RECONNECT_DELAY, delay * 3))
+                    
+                    if not self.is_running:
+                        break
+                    
+                    if len(failures) >= WS_BREAKER_FAILURES:
+                        logger.warning(f"{len(failures)} failures on {connection_name} in {WS_BREAKER_WINDOW}s - pausing reconnects for {WS_BREAKER_COOLDOWN} seconds")
+                        await asyncio.sleep(WS_BREAKER_COOLDOWN)
+                        failures.clear()
+                        delay = WS_RECONNECT_DELAY
+                    else:
+                        logger.info(f"Reconnecting to {connection_name} in {delay:.1f} seconds...")
+                        await asyncio.sleep(delay)
+            finally:
+                worker.cancel()
         
         # Start the WebSocket handler
         asyncio.create_task(websocket_handler())
     
-    async def start_websocket_streams(self, symbols: List[str], ticker_callback: Callable = None, kline_callback: Callable = None):
-        """Start all WebSocket streams."""
+    async def start_websocket_streams(self, symbols: List[str], ticker_callback: Callable = None, kline_callback: Callable = None,
+                                      all_tickers_callback: Callable = None):
+        """
+        Start all WebSocket streams.
+        
+        all_tickers_callback uses the single !ticker@arr stream instead of one
+        @ticker stream per symbol; it gets the formatted tickers of `symbols`
+        that changed, once per frame.
+        """
         self.is_running = True
         
+        # Pack ticker and kline streams into shared connections instead of one set per type
+        streams = []
+        callbacks = {}
         if ticker_callback:
-            await self.subscribe_ticker_stream(symbols, ticker_callback)
+            streams += [f"{symbol.lower()}@ticker" for symbol in symbols]
+            callbacks["ticker"] = ticker_callback
+        
+        if all_tickers_callback:
+            wanted = set(symbols)
+            
+            async def on_all_tickers(events: List[Dict]):
+                events = [event for event in events if event.get("s") in wanted]
+                if events:
+                    await all_tickers_callback(self._format_stream_tickers(events))
+            
+            streams.append("!ticker@arr")
+            callbacks["arr"] = on_all_tickers  # "!ticker@arr" dispatches as type "arr"
         
         if kline_callback:
             for interval in ['1m', '1h']:
-                await self.subscribe_kline_stream(symbols, interval, kline_callback)
+                streams += [f"{symbol.lower()}@kline_{interval}" for symbol in symbols]
+            callbacks["kline"] = kline_callback
+        
+        await self._subscribe_chunked(streams, "combined", callbacks)
         
         logger.info("WebSocket streams started")
     
     def stop_websocket_streams(self):
         """Stop all WebSocket streams."""
         self.is_running = False
+        
+        # Close the shared REST session on the loop that owns it
+        if self._session is not None and not self._session.closed:
+            try:
+                asyncio.get_running_loop().create_task(self.close())
+            except RuntimeError:
+                logger.warning("No running event loop - REST session left for garbage collection")
+        
         logger.info("WebSocket streams stopped")
     
     def get_account_info(self) -> Optional[Dict]:
@@ -1,12 +1,75 @@
-from dotenv import load_dotenv
-import os
+import functools
+import orjson
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config.settings import COINGECKO_API_KEY
 
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
+COINGECKO_MARKETS_URL = "https://api.coingecko.com/api/v3/coins/markets"
+COINGECKO_PAGE_SIZE = 250  # max per_page accepted by coins/markets
+
+# pooled keep-alive session so repeated refreshes skip the TCP+TLS handshake
+_SESSION = requests.Session()
+_SESSION.headers["Connection"] = "keep-alive"
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+
+# CoinGecko ID mapping for common symbols
+SYMBOL_MAPPING = {
+    'BTCUSDT': 'bitcoin',
+    'ETHUSDT': 'ethereum',
+    'ADAUSDT': 'cardano',
+    'BNBUSDT': 'binancecoin',
+    'XRPUSDT': 'ripple',
+    'SOLUSDT': 'solana',
+    'DOTUSDT': 'polkadot',
+    'DOGEUSDT': 'dogecoin',
+    'AVAXUSDT': 'avalanche-2',
+    'LINKUSDT': 'chainlink',
+    'LTCUSDT': 'litecoin',
+    'BCHUSDT': 'bitcoin-cash',
+    'UNIUSDT': 'uniswap',
+    'ATOMUSDT': 'cosmos',
+    'ETCUSDT': 'ethereum-classic',
+    'XLMUSDT': 'stellar',
+    'TRXUSDT': 'tron',
+    'FILUSDT': 'filecoin',
+    'NEARUSDT': 'near',
+    'ALGOUSDT': 'algorand'
+}
+
+@functools.lru_cache(maxsize=4096)
+def _to_cg_id(symbol: str) -> str:
+    """Resolve a Binance symbol to its CoinGecko ID (mapped, else the lowercased base asset)."""
+    return SYMBOL_MAPPING.get(symbol) or symbol.removesuffix('USDT').lower()
+
+def _fetch_markets_page(ids: list[str], headers: dict) -> list[dict]:
+    """Fetch one page of coins/markets rows for up to COINGECKO_PAGE_SIZE ids."""
+    params = {
+        "vs_currency": "usd",
+        "ids": ",".join(ids),
+        "order": "market_cap_desc",
+        "per_page": COINGECKO_PAGE_SIZE,
+        "page": 1,
+        "sparkline": "false"
+    }
+    logger.info(f"Parameters: {params}")
+    
+    response = _SESSION.get(COINGECKO_MARKETS_URL, headers=headers, params=params, timeout=10)
+    logger.info(f"Response status: {response.status_code}")
+    
+    if response.status_code != 200:
+        logger.error(f"Response text: {response.text}")
+    
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 def fetch_coingecko_data(symbols: list[str]) -> dict[str, dict]:
     """
@@ -20,83 +83,30 @@ def fetch_coingecko_data(symbols: list[str]) -> dict[str, dict]:
         - market_cap: float
         - fdv: float (fully diluted valuation)
     """
-    # Get API key from environment
-    api_key = os.getenv("COINGECKO_API_KEY", "CG-tAhqifbeGmbb9nJ8k6ACeDdM")
+    # Public API unless a Pro key is configured
+    headers = {"X-CG-Pro-API-Key": COINGECKO_API_KEY} if COINGECKO_API_KEY else {}
     
-    # For debugging, try without API key first
-    headers = {}
-    if api_key and api_key != "CG-tAhqifbeGmbb9nJ8k6ACeDdM":
-        headers = {"X-CG-Pro-API-Key": api_key}
-    
-    # Convert Binance symbols to CoinGecko IDs
-    symbol_to_id = {}
-    coingecko_ids = []
-    
-    # CoinGecko ID mapping for common symbols
-    symbol_mapping = {
-        'BTCUSDT': 'bitcoin',
-        'ETHUSDT': 'ethereum',
-        'ADAUSDT': 'cardano',
-        'BNBUSDT': 'binancecoin',
-        'XRPUSDT': 'ripple',
-        'SOLUSDT': 'solana',
-        'DOTUSDT': 'polkadot',
-        'DOGEUSDT': 'dogecoin',
-        'AVAXUSDT': 'avalanche-2',
-        'LINKUSDT': 'chainlink',
-        'LTCUSDT': 'litecoin',
-        'BCHUSDT': 'bitcoin-cash',
-        'UNIUSDT': 'uniswap',
-        'ATOMUSDT': 'cosmos',
-        'ETCUSDT': 'ethereum-classic',
-        'XLMUSDT': 'stellar',
-        'TRXUSDT': 'tron',
-        'FILUSDT': 'filecoin',
-        'NEARUSDT': 'near',
-        'ALGOUSDT': 'algorand'
-    }
-    
-    for symbol in symbols:
-        # Use mapping if available, otherwise try simple conversion
-        if symbol in symbol_mapping:
-            coingecko_id = symbol_mapping[symbol]
-        else:
-            # Remove 'USDT' and convert to lowercase as fallback
-            coingecko_id = symbol.replace('USDT', '').lower()
-        
-        coingecko_ids.append(coingecko_id)
-        symbol_to_id[symbol] = coingecko_id
+    # Convert Binance symbols to CoinGecko IDs (dict.fromkeys drops duplicates, keeps order)
+    symbol_to_id = {symbol: _to_cg_id(symbol) for symbol in dict.fromkeys(symbols)}
+    coingecko_ids = list(dict.fromkeys(symbol_to_id.values()))
     
     if not coingecko_ids:
         return {}
     
-    # Prepare API request - using Coins Markets endpoint
-    url = "https://api.coingecko.com/api/v3/coins/markets"
-    params = {
-        "vs_currency": "usd",
-        "ids": ",".join(coingecko_ids),
-        "order": "market_cap_desc",
-        "per_page": len(coingecko_ids),
-        "page": 1,
-        "sparkline": "false"
-    }
+    # coins/markets returns at most 250 rows per page, so request the ids in chunks
+    chunks = [
+        coingecko_ids[i:i + COINGECKO_PAGE_SIZE]
+        for i in range(0, len(coingecko_ids), COINGECKO_PAGE_SIZE)
+    ]
     
     try:
-        logger.info(f"Making CoinGecko API request to: {url}")
-        logger.info(f"Parameters: {params}")
-        logger.info(f"Headers: {headers}")
-        
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        logger.info(f"Response status: {response.status_code}")
+        logger.info(f"Making {len(chunks)} CoinGecko API request(s) to: {COINGECKO_MARKETS_URL}")
         
-        if response.status_code != 200:
-            logger.error(f"Response text: {response.text}")
-            
-        response.raise_for_status()
-        data = response.json()
+        with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as pool:
+            pages = list(pool.map(lambda ids: _fetch_markets_page(ids, headers), chunks))
         
         # Create a mapping from CoinGecko ID to data
-        id_to_data = {item["id"]: item for item in data}
+        id_to_data = {item["id"]: item for page in pages for item in page}
         
         # Process response
         result = {}
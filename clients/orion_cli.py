@@ -1,11 +1,57 @@
 import json
+import orjson
 import subprocess
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
-from clients.binance import get_open_interest, get_latest_funding_rate
+from clients.binance import get_open_interest, get_all_funding_rates
 
 logger = logging.getLogger(__name__)
 
+# Last parsed perpetuals dump as (monotonic fetch time, {symbol: record}), shared by every caller
+_CACHE_TTL = 2.0
+_LAST = (0.0, {})
+_LAST_LOCK = threading.Lock()
+
+def _run_cli_json(cmd: List[str], timeout: int = 30) -> Any:
+    """
+    Run an Orion CLI command and parse its JSON stdout.
+    Output stays as bytes end to end - no text decode before orjson parses it.
+    """
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=stdout, stderr=stderr)
+    return orjson.loads(stdout)
+
+def _load_perpetuals() -> Dict[str, Any]:
+    """
+    Run the Orion CLI perpetuals dump and index it by symbol.
+    The parsed dict is reused for _CACHE_TTL seconds; the lock makes concurrent
+    callers wait for one CLI run instead of each spawning their own.
+    """
+    global _LAST
+    with _LAST_LOCK:
+        fetched_at, raw_dict = _LAST
+        if raw_dict and time.monotonic() - fetched_at < _CACHE_TTL:
+            return raw_dict
+        
+        cmd = ["clients/cli/cli", "market", "perpetuals", "--json"]
+        logger.info(f"Executing Orion CLI command: {' '.join(cmd)}")
+        raw = _run_cli_json(cmd, timeout=30)
+        logger.info(f"Orion CLI returned {len(raw)} perpetual records")
+        
+        raw_dict = {item["symbol"]: item for item in raw}
+        _LAST = (time.monotonic(), raw_dict)
+        return raw_dict
+
 def fetch_orion_data(symbols: List[str]) -> Dict[str, Any]:
     """
     Calls the Orion Terminal CLI in JSON mode to get all perpetuals.
@@ -13,35 +59,17 @@ def fetch_orion_data(symbols: List[str]) -> Dict[str, Any]:
     Returns: { symbol: { 'tickCount': ..., 'fundingRate': ..., ... } }
     """
     try:
-        cmd = ["clients/cli/cli", "market", "perpetuals", "--json"]
-        logger.info(f"Executing Orion CLI command: {' '.join(cmd)}")
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30
-        )
-        raw = json.loads(result.stdout)
-        logger.info(f"Orion CLI returned {len(raw)} perpetual records")
+        raw_dict = _load_perpetuals()
         
         # Only return data for symbols that Orion actually has
-        raw_dict = {item["symbol"]: item for item in raw}
-        result_dict = {}
-        found_symbols = []
-        missing_symbols = []
-        
-        for sym in symbols:
-            if sym in raw_dict:
-                result_dict[sym] = raw_dict[sym]
-                found_symbols.append(sym)
-            else:
-                missing_symbols.append(sym)
+        raw_keys = raw_dict.keys()
+        result_dict = {sym: raw_dict[sym] for sym in symbols if sym in raw_keys}
+        missing_symbols = [sym for sym in symbols if sym not in raw_keys]
         
         if missing_symbols:
             logger.warning(f"Orion CLI returned no data for: {missing_symbols[:10]}{'...' if len(missing_symbols) > 10 else ''} ({len(missing_symbols)} total)")
             
-        logger.info(f"Orion CLI data available for {len(found_symbols)} symbols")
+        logger.info(f"Orion CLI data available for {len(result_dict)} symbols")
         return result_dict
         
     except subprocess.TimeoutExpired:
@@ -49,7 +77,7 @@ def fetch_orion_data(symbols: List[str]) -> Dict[str, Any]:
         return {}
     except subprocess.CalledProcessError as e:
         logger.error(f"Orion CLI command failed with exit code {e.returncode}")
-        logger.error(f"stderr: {e.stderr}")
+        logger.error(f"stderr: {e.stderr.decode(errors='replace')}")
         return {}
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse Orion CLI JSON output: {e}")
@@ -64,33 +92,32 @@ def fetch_orion_data_with_fallback(symbols: List[str]) -> Dict[str, Any]:
     THIS IS SLOW - only use for small symbol lists!
     """
     try:
-        cmd = ["clients/cli/cli", "market", "perpetuals", "--json"]
-        logger.info(f"Executing Orion CLI command: {' '.join(cmd)}")
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30
-        )
-        raw = json.loads(result.stdout)
-        logger.info(f"Orion CLI returned {len(raw)} perpetual records")
-        raw_dict = {item["symbol"]: item for item in raw}
-        result_dict = {}
-        missing = []
+        raw_dict = _load_perpetuals()
+        raw_keys = raw_dict.keys()
+        missing = [sym for sym in symbols if sym not in raw_keys]
+        fallback = {}
         
-        for sym in symbols:
-            if sym in raw_dict:
-                result_dict[sym] = raw_dict[sym]
-            else:
-                missing.append(sym)
-                # fallback via Binance REST
-                logger.info(f"Fetching Binance data for {sym}")
-                result_dict[sym] = {
+        if missing:
+            # fallback via Binance REST - one bulk funding call, OI has no bulk endpoint.
+            # A failed funding call shouldn't throw away the CLI data we already have.
+            try:
+                funding_rates = get_all_funding_rates()
+            except Exception as e:
+                logger.error(f"Error fetching Binance funding rates: {e}")
+                funding_rates = {}
+            logger.info(f"Fetching Binance open interest for {len(missing)} symbols")
+            with ThreadPoolExecutor(max_workers=min(16, len(missing))) as pool:
+                open_interest = dict(zip(missing, pool.map(get_open_interest, missing)))
+            fallback = {
+                sym: {
                     "tickCount":    0,
-                    "fundingRate":  get_latest_funding_rate(sym),
-                    "openInterest": get_open_interest(sym)
+                    "fundingRate":  funding_rates.get(sym, 0.0),
+                    "openInterest": open_interest[sym]
                 }
+                for sym in missing
+            }
+        
+        result_dict = {sym: raw_dict[sym] if sym in raw_keys else fallback[sym] for sym in symbols}
         
         if missing:
             logger.warning(f"Orion CLI returned no data for: {missing}, used REST fallback")
@@ -101,7 +128,7 @@ def fetch_orion_data_with_fallback(symbols: List[str]) -> Dict[str, Any]:
         return {}
     except subprocess.CalledProcessError as e:
         logger.error(f"Orion CLI command failed with exit code {e.returncode}")
-        logger.error(f"stderr: {e.stderr}")
+        logger.error(f"stderr: {e.stderr.decode(errors='replace')}")
         return {}
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse Orion CLI JSON output: {e}")
@@ -137,7 +164,7 @@ def get_orion_perpetuals_test() -> Dict[str, Any]:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
         
         if result.returncode == 0:
-            raw = json.loads(result.stdout)
+            raw = orjson.loads(result.stdout)
             return {item["symbol"]: item for item in raw}
         else:
             logger.error(f"Orion CLI test failed: {result.stderr}")
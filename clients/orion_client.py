@@ -1,23 +1,51 @@
+import asyncio
 import logging
+import orjson
 import requests
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional
-from config.settings import ORION_API_KEY, ORION_BASE_URL
+from clients._cache import cache_methods
+from utils.helpers import run_async
+from config.settings import ORION_API_KEY, ORION_BASE_URL, ORION_MAX_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 
 class OrionClient:
     """Client for fetching market data from Orion Protocol."""
     
+    # Endpoints cached per instance, with their TTLs in seconds
+    _CACHED_METHODS = {
+        "get_market_data": 10,
+        "get_liquidity_pools": 60,
+        "get_trading_pairs": 3600,
+        "get_order_book": 2,
+        "get_recent_trades": 2,
+        "get_market_data_async": 10,
+        "get_order_book_async": 2,
+        "get_recent_trades_async": 2,
+    }
+    
     def __init__(self):
         self.api_key = ORION_API_KEY
         self.base_url = ORION_BASE_URL
         self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.headers = {}
+        cache_methods(self, self._CACHED_METHODS)
         
         if self.api_key:
-            self.session.headers.update({
+            self.headers = {
                 'Authorization': f'Bearer {self.api_key}',
                 'Content-Type': 'application/json'
-            })
+            }
+            self.session.headers.update(self.headers)
             logger.info("Orion client initialized with API key")
         else:
             logger.warning("Orion API key not found - some endpoints may not work")
@@ -40,15 +68,7 @@ class OrionClient:
     
     def get_multi_market_data(self, symbols: List[str]) -> Dict[str, Dict]:
         """Get market data for multiple symbols."""
-        results = {}
-        
-        for symbol in symbols:
-            data = self.get_market_data(symbol)
-            if data:
-                results[symbol] = data
-        
-        logger.info(f"Fetched Orion data for {len(results)} symbols")
-        return results
+        return self._run_sync(self.get_multi_market_data_async(symbols))
     
     def get_liquidity_pools(self, symbol: str) -> Optional[List[Dict]]:
         """Get liquidity pool information for a symbol."""
@@ -118,27 +138,108 @@ class OrionClient:
     
     def get_aggregated_data(self, symbols: List[str]) -> Dict[str, Dict]:
         """Get aggregated market data for multiple symbols."""
-        aggregated_data = {}
+        return self._run_sync(self.get_aggregated_data_async(symbols))
+    
+    def _run_sync(self, coro):
+        """Run an async method to completion for sync callers, closing the session it opened."""
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.close()
         
-        for symbol in symbols:
-            symbol_data = {}
+        return run_async(runner())
+    
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared aiohttp session used by the async methods."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers=self.headers
+            )
+        return self._session
+    
+    async def _get_json_async(self, path: str, params: Optional[Dict] = None):
+        """GET an Orion endpoint on the shared session and return the parsed JSON."""
+        session = await self._ensure_session()
+        async with session.get(f"{self.base_url}{path}", params=params) as response:
+            response.raise_for_status()
+            return orjson.loads(await response.read())
+    
+    async def get_market_data_async(self, symbol: str) -> Optional[Dict]:
+        """Async variant of get_market_data."""
+        try:
+            return await self._get_json_async(f"/v1/market-data/{symbol}")
+        except aiohttp.ClientError as e:
+            logger.error(f"Error fetching Orion market data for {symbol}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error fetching Orion data for {symbol}: {e}")
+            return None
+    
+    async def get_order_book_async(self, symbol: str, depth: int = 20) -> Optional[Dict]:
+        """Async variant of get_order_book."""
+        try:
+            return await self._get_json_async(f"/v1/order-book/{symbol}", {"depth": depth})
+        except aiohttp.ClientError as e:
+            logger.error(f"Error fetching Orion order book for {symbol}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error fetching Orion order book for {symbol}: {e}")
+            return None
+    
+    async def get_recent_trades_async(self, symbol: str, limit: int = 100) -> Optional[List[Dict]]:
+        """Async variant of get_recent_trades."""
+        try:
+            return await self._get_json_async(f"/v1/recent-trades/{symbol}", {"limit": limit})
+        except aiohttp.ClientError as e:
+            logger.error(f"Error fetching Orion recent trades for {symbol}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error fetching Orion recent trades for {symbol}: {e}")
+            return None
+    
+    async def get_multi_market_data_async(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Fetch market data for many symbols concurrently."""
+        semaphore = asyncio.Semaphore(ORION_MAX_CONCURRENCY)
+        
+        async def fetch(symbol: str):
+            async with semaphore:
+                return await self.get_market_data_async(symbol)
+        
+        data = await asyncio.gather(*[fetch(symbol) for symbol in symbols])
+        results = {symbol: d for symbol, d in zip(symbols, data) if d}
+        
+        logger.info(f"Fetched Orion data for {len(results)} symbols")
+        return results
+    
+    async def get_aggregated_data_async(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Fetch market data, order book and recent trades for many symbols concurrently."""
+        semaphore = asyncio.Semaphore(ORION_MAX_CONCURRENCY)
+        
+        async def fetch(symbol: str) -> Dict:
+            async with semaphore:
+                market_data, order_book, recent_trades = await asyncio.gather(
+                    self.get_market_data_async(symbol),
+                    self.get_order_book_async(symbol),
+                    self.get_recent_trades_async(symbol)
+                )
             
-            # Get market data
-            market_data = self.get_market_data(symbol)
+            symbol_data = {}
             if market_data:
                 symbol_data.update(market_data)
-            
-            # Get order book
-            order_book = self.get_order_book(symbol)
             if order_book:
                 symbol_data['order_book'] = order_book
-            
-            # Get recent trades
-            recent_trades = self.get_recent_trades(symbol)
             if recent_trades:
                 symbol_data['recent_trades'] = recent_trades
-            
-            if symbol_data:
-                aggregated_data[symbol] = symbol_data
+            return symbol_data
         
-        return aggregated_data 
\ No newline at end of file
+        results = await asyncio.gather(*[fetch(symbol) for symbol in symbols])
+        return {symbol: data for symbol, data in zip(symbols, results) if data}
+    
+    async def close(self):
+        """Close the shared aiohttp session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -1,16 +1,21 @@
-import asyncio
-import json
+from collections import deque, namedtuple
+import orjson
 import websockets
 import logging
 
 logger = logging.getLogger(__name__)
 
+# One aggTrade print; a tuple is about half the size of the equivalent dict
+Tick = namedtuple("Tick", ["symbol", "price", "qty", "timestamp"])
+
 class WebSocketClient:
-    def __init__(self, symbols, queue):
+    def __init__(self, symbols, maxlen=8192):
         # symbols: list of strings like ["BTCUSDT",…]
-        # queue: an asyncio.Queue to push parsed tick data
+        # ticks: bounded buffer of Tick tuples, oldest dropped when full.
+        # deque append/popleft are thread-safe, so a consumer on another thread can drain it directly
         self.symbols = symbols
-        self.queue = queue
+        self._url = self._build_stream_url()  # fixed for the client's lifetime
+        self.ticks = deque(maxlen=maxlen)
         self.running = True
 
     def _build_stream_url(self):
@@ -19,16 +24,19 @@ class WebSocketClient:
         return f"wss://fstream.binance.com/stream?streams={streams}"
 
     async def run(self):
-        url = self._build_stream_url()
+        url = self._url
         logger.info(f"Connecting to WebSocket: {url}")
         
         try:
             async with websockets.connect(url) as ws:
                 logger.info("WebSocket connected successfully")
+                # bound once - the loop below runs for every trade
+                recv = ws.recv
+                ticks_append = self.ticks.append
                 while self.running:
                     try:
-                        msg = await ws.recv()
-                        data = json.loads(msg)
+                        msg = await recv()
+                        data = orjson.loads(msg)
                         
                         # Handle subscription confirmation
                         if "result" in data:
@@ -38,13 +46,12 @@ class WebSocketClient:
                         # Handle trade data
                         if "data" in data:
                             tick_data = data["data"]
-                            tick = {
-                                "symbol": tick_data["s"],
-                                "price": float(tick_data["p"]),
-                                "qty": float(tick_data["q"]),
-                                "timestamp": tick_data["T"]
-                            }
-                            await self.queue.put(tick)
+                            ticks_append(Tick(
+                                tick_data["s"],
+                                float(tick_data["p"]),
+                                float(tick_data["q"]),
+                                tick_data["T"]
+                            ))
                             
                     except websockets.exceptions.ConnectionClosed:
                         logger.warning("WebSocket connection closed, attempting to reconnect...")
@@ -56,6 +63,12 @@ class WebSocketClient:
         except Exception as e:
             logger.error(f"WebSocket connection error: {e}")
             
+    def drain(self, max_items=None):
+        """Pop up to max_items buffered ticks (all when None), oldest first. Safe from any thread."""
+        ticks = self.ticks
+        n = len(ticks) if max_items is None else min(max_items, len(ticks))
+        return [ticks.popleft() for _ in range(n)]
+
     def stop(self):
         """Stop the WebSocket client."""
         self.running = False 
\ No newline at end of file
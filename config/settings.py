@@ -1,21 +1,62 @@
 import os
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Environment-derived settings, read once at import. Secrets have no defaults."""
+    binance_api_key: Optional[str]
+    binance_api_secret: Optional[str]
+    binance_testnet: bool
+    orion_api_key: Optional[str]
+    coingecko_api_key: Optional[str]
+    redis_url: Optional[str]
+    database_url: str
+    log_level: str
+
+
+def _load() -> Settings:
+    # Load environment variables
+    load_dotenv()
+    return Settings(
+        binance_api_key=os.getenv('BINANCE_API_KEY'),
+        binance_api_secret=os.getenv('BINANCE_API_SECRET'),
+        binance_testnet=os.getenv('BINANCE_TESTNET', 'false').lower() == 'true',
+        orion_api_key=os.getenv('ORION_API_KEY'),
+        coingecko_api_key=os.getenv('COINGECKO_API_KEY'),
+        redis_url=os.getenv('REDIS_URL'),
+        database_url=os.getenv('DATABASE_URL', 'sqlite:///trading_data.db'),
+        log_level=os.getenv('LOG_LEVEL', 'INFO'),
+    )
+
+
+SETTINGS = _load()
 
 # ─── Binance Configuration ─────────────────────────────────────────────────────
-BINANCE_API_KEY = os.getenv('BINANCE_API_KEY', 'F7Fhhm7itvJsJfbozDvyBRNnVDCpi3wJizbtw21Z8x936npXpyDAJl8G5Fvb8Wh4')
-BINANCE_API_SECRET = os.getenv('BINANCE_API_SECRET', 'V7Of4i64f31IirRfalQrBuHa9fQcpwSNSN4x5Lq4GhuL2rTuiJ55xAg6RUnooqX3')
-BINANCE_TESTNET = os.getenv('BINANCE_TESTNET', 'false').lower() == 'true'
+BINANCE_API_KEY = SETTINGS.binance_api_key
+BINANCE_API_SECRET = SETTINGS.binance_api_secret
+BINANCE_TESTNET = SETTINGS.binance_testnet
 
 # Binance API endpoints
 BINANCE_REST_URL = "https://testnet.binancefuture.com" if BINANCE_TESTNET else "https://fapi.binance.com"
 BINANCE_WS_URL = "wss://stream.binancefuture.com" if not BINANCE_TESTNET else "wss://stream.binancefuture.com"
 
+# Identifies the app on every HTTP request; some endpoints throttle library-default agents harder
+HTTP_USER_AGENT = "jumptrader/1.0"
+
+# ─── CoinGecko Configuration ──────────────────────────────────────────────────
+COINGECKO_API_KEY = SETTINGS.coingecko_api_key
+
 # ─── Orion Configuration ──────────────────────────────────────────────────────
-ORION_API_KEY = os.getenv('ORION_API_KEY')
+ORION_API_KEY = SETTINGS.orion_api_key
 ORION_BASE_URL = "https://api.orionprotocol.io"
+ORION_MAX_CONCURRENCY = 20  # in-flight symbols for the async Orion fan-out
+
+# ─── Shared Cache ─────────────────────────────────────────────────────────────
+# Redis URL for the cross-process market cache; unset disables it
+REDIS_URL = SETTINGS.redis_url
 
 # ─── Data Collection Settings ─────────────────────────────────────────────────
 # Candle intervals and limits
@@ -27,8 +68,18 @@ CANDLE_INTERVALS = {
 }
 
 # WebSocket settings
-WS_RECONNECT_DELAY = 5  # seconds
+WS_RECONNECT_DELAY = 5  # seconds, base of the jittered reconnect backoff
+WS_RECONNECT_MAX_DELAY = 60  # seconds, backoff cap
+WS_BREAKER_FAILURES = 5  # connection failures within the window that open the circuit
+WS_BREAKER_WINDOW = 60  # seconds
+WS_BREAKER_COOLDOWN = 120  # seconds the circuit stays open before retrying
 WS_HEARTBEAT_INTERVAL = 30  # seconds
+WS_QUEUE_SIZE = 1024  # buffered messages per connection before the oldest is dropped
+WS_DISPATCH_BATCH = 512  # messages the dispatch task takes per wake-up
+WS_PING_INTERVAL = 20  # seconds between client pings
+WS_PING_TIMEOUT = 10  # seconds to wait for a pong before dropping the connection
+WS_MAX_MESSAGE_SIZE = 2 ** 22  # bytes; combined streams can burst large frames
+WS_MAX_QUEUE = 64  # frames the websockets library buffers before applying backpressure
 
 # Polling intervals
 ORION_POLL_INTERVAL = 15  # seconds
@@ -55,10 +106,10 @@ MAX_SYMBOLS_DISPLAY = 500
 AUTO_REFRESH_INTERVAL = 60  # seconds
 
 # ─── Database Settings (Future) ──────────────────────────────────────────────
-DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///trading_data.db')
+DATABASE_URL = SETTINGS.database_url
 
 # ─── Logging Configuration ────────────────────────────────────────────────────
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_LEVEL = SETTINGS.log_level
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
 # ─── Feature Flags ────────────────────────────────────────────────────────────
@@ -1,10 +1,11 @@
-import os
-from dotenv import load_dotenv
+from functools import lru_cache
 from binance.client import Client
+from config.settings import SETTINGS
 
+@lru_cache(maxsize=1)
 def get_binance_client():
     """
-    Load environment variables and return an initialized Binance client.
+    Return the process-wide Binance client, built on first use.
     
     Returns:
         Client: Initialized Binance client with API credentials
@@ -12,22 +13,14 @@ def get_binance_client():
     Raises:
         ValueError: If API credentials are not found in environment variables
     """
-    # Load environment variables from .env file
-    load_dotenv()
-    
-    # Get API credentials from environment variables
-    api_key = os.getenv('BINANCE_API_KEY', 'F7Fhhm7itvJsJfbozDvyBRNnVDCpi3wJizbtw21Z8x936npXpyDAJl8G5Fvb8Wh4')
-    api_secret = os.getenv('BINANCE_API_SECRET', 'V7Of4i64f31IirRfalQrBuHa9fQcpwSNSN4x5Lq4GhuL2rTuiJ55xAg6RUnooqX3')
-    
     # Validate that credentials are provided
-    if not api_key or not api_secret:
+    if not SETTINGS.binance_api_key or not SETTINGS.binance_api_secret:
         raise ValueError(
             "BINANCE_API_KEY and BINANCE_API_SECRET must be set in environment variables or .env file"
         )
     
     # Initialize and return the Binance client
-    client = Client(api_key, api_secret)
-    return client
+    return Client(SETTINGS.binance_api_key, SETTINGS.binance_api_secret)
 
 def test_connection():
     """
@@ -1,58 +1,112 @@
 import streamlit as st
-import requests
 import pandas as pd
+import numpy as np
+import orjson
 import time
+import logging
+import threading
+import asyncio
+import aiohttp
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from credentials import get_binance_client
+from clients._ratelimit import RateLimitedSession, BINANCE_FUTURES_LIMITER, klines_weight
+from config.settings import HTTP_USER_AGENT
+from utils.helpers import run_async
 
 # ─── Config ─────────────────────────────────────────────────────────────────────
 st.set_page_config(page_title="Binance AI Trade Radar", layout="wide")
 st.title("📊 Binance Perpetuals Dashboard — v1")
 
+logger = logging.getLogger(__name__)
+
 EXCHANGE_INFO = "https://fapi.binance.com/fapi/v1/exchangeInfo"
 TICKER_24H   = "https://fapi.binance.com/fapi/v1/ticker/24hr"
 KLINES       = "https://fapi.binance.com/fapi/v1/klines"
 
+# 24h ticker fields the table shows, and their column names
+STATS_COLUMNS = {"priceChangePercent": "chg24h", "quoteVolume": "vol24h", "lastPrice": "lastPrice"}
+TABLE_COLUMNS = ["symbol", "lastPrice", "chg1h", "chg24h", "vol24h"]
+
+SYMBOL_FIELDS = itemgetter("symbol", "contractType", "status")  # one C call per exchangeInfo entry
+
+# one keep-alive session for every request the loop makes; the limiter reads
+# X-MBX-USED-WEIGHT-1m and only waits when the minute's weight budget runs out.
+# cache_resource keeps it across reruns, which re-execute this script.
+@st.cache_resource
+def get_http():
+    http = RateLimitedSession(BINANCE_FUTURES_LIMITER)
+    http.mount("https://", HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[429, 500, 502, 503, 504])
+    ))
+    return http
+
 # ─── Helpers ────────────────────────────────────────────────────────────────────
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600)  # one tuple shared by every session
 def get_perpetual_symbols():
-    data = requests.get(EXCHANGE_INFO).json()
-    return [
-        s["symbol"]
-        for s in data["symbols"]
-        if s["contractType"] == "PERPETUAL" and s["status"] == "TRADING"
-    ]
+    data = orjson.loads(get_http().get(EXCHANGE_INFO, timeout=10).content)
+    return tuple(
+        symbol
+        for symbol, contract_type, status in map(SYMBOL_FIELDS, data["symbols"])
+        if contract_type == "PERPETUAL" and status == "TRADING"
+    )
 
-def get_24h_stats(symbol):
-    r = requests.get(f"{TICKER_24H}?symbol={symbol}").json()
-    return {
-        "symbol": symbol,
-        "chg24h": float(r.get("priceChangePercent", 0)),
-        "vol24h": float(r.get("quoteVolume", 0)),
-        "lastPrice": float(r.get("lastPrice", 0)),
-    }
+def get_24h_stats_bulk():
+    # no symbol param -> one request returns every perpetual's 24h ticker,
+    # loaded straight into typed columns indexed by symbol
+    data = orjson.loads(get_http().get(TICKER_24H, timeout=10, weight=40).content)
+    df = pd.DataFrame(data, columns=["symbol", *STATS_COLUMNS])
+    df = df.astype({col: float for col in STATS_COLUMNS}).fillna(0.0).rename(columns=STATS_COLUMNS)
+    return df.set_index("symbol", drop=False)
 
-def get_1h_change(symbol):
+async def get_1h_change(session, semaphore, symbol):
     params = {
         "symbol": symbol,
         "interval": "1h",
         "limit": 2  # last two candles
     }
-    klines = requests.get(KLINES, params=params).json()
+    try:
+        async with semaphore:
+            await BINANCE_FUTURES_LIMITER.acquire_async(klines_weight(params["limit"]))
+            async with session.get(KLINES, params=params) as response:
+                BINANCE_FUTURES_LIMITER.update(response.headers, response.status)
+                response.raise_for_status()
+                klines = orjson.loads(await response.read())
+    except Exception as e:
+        logger.error(f"Error fetching klines for {symbol}: {e}")
+        return 0.0
     if len(klines) < 2:
         return 0.0
     prev_close = float(klines[0][4])
     last_close = float(klines[1][4])
     return (last_close - prev_close) / prev_close * 100
 
-def compute_signals(row):
-    tags = []
-    if row["vol24h"] > 500_000_000:
-        tags.append("🔥 Volume Spike")
-    if row["chg1h"] > 5:
-        tags.append("📈 1H Gainer")
-    if abs(row["chg24h"]) > 10:
-        tags.append("⚠️ Volatile")
-    return ", ".join(tags) if tags else "-"
+async def gather_1h_changes(symbols):
+    # klines has no multi-symbol form - run every request on one event loop and connection pool
+    semaphore = asyncio.Semaphore(20)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=32), timeout=timeout,
+                                     headers={"User-Agent": HTTP_USER_AGENT}) as session:
+        changes = await asyncio.gather(*[get_1h_change(session, semaphore, sym) for sym in symbols])
+    return dict(zip(symbols, changes))
+
+def get_1h_changes(symbols):
+    return run_async(gather_1h_changes(symbols))
+
+def compute_signals(df):
+    # one boolean mask per tag over the whole frame instead of df.apply per row
+    tags = [
+        (df["vol24h"].to_numpy() > 500_000_000, "🔥 Volume Spike"),
+        (df["chg1h"].to_numpy() > 5, "📈 1H Gainer"),
+        (np.abs(df["chg24h"].to_numpy()) > 10, "⚠️ Volatile"),
+    ]
+    out = np.full(len(df), "", dtype=object)
+    for mask, label in tags:
+        out = np.where(mask, out + ", " + label, out)
+    return pd.Series(out, index=df.index).str.removeprefix(", ").replace("", "-")
 
 # ─── UI Controls ────────────────────────────────────────────────────────────────
 symbols = get_perpetual_symbols()
@@ -82,24 +136,75 @@ if st.button("Test Private API Connection"):
 # ─── Public Data Dashboard ─────────────────────────────────────────────────────
 st.subheader("📊 Public Market Data")
 
-placeholder = st.empty()
+# ─── Background Fetcher ────────────────────────────────────────────────────────
+@st.cache_resource
+def start_fetcher():
+    """
+    Start one fetch thread for the whole server. Sessions only read its latest
+    rows, so M open dashboards cost one fetch loop instead of M.
+    """
+    state = {
+        "lock": threading.Lock(),
+        "wake": threading.Event(),
+        "symbols": [],
+        "count": 0,       # largest symbol count any session has asked for
+        "refresh": 60,
+        "frame": pd.DataFrame(columns=TABLE_COLUMNS),
+        "updated": None,
+    }
+
+    def fetch_loop():
+        while True:
+            with state["lock"]:
+                shown = state["symbols"][:state["count"]]
+                interval = state["refresh"]
+            if shown:
+                try:
+                    stats = get_24h_stats_bulk()
+                    changes_1h = get_1h_changes(shown)
+                    frame = stats.loc[[sym for sym in shown if sym in stats.index]].reset_index(drop=True)
+                    frame["chg1h"] = frame["symbol"].map(changes_1h)
+                    with state["lock"]:
+                        state["frame"] = frame[TABLE_COLUMNS]
+                        state["updated"] = time.time()
+                except Exception as e:
+                    logger.error(f"Error refreshing dashboard data: {e}")
+            state["wake"].wait(timeout=interval)
+            state["wake"].clear()
+
+    threading.Thread(target=fetch_loop, name="dashboard-v1-fetcher", daemon=True).start()
+    return state
+
+# ─── Render ────────────────────────────────────────────────────────────────────
+state = start_fetcher()
+with state["lock"]:
+    state["symbols"] = symbols
+    state["refresh"] = refresh
+    if count > state["count"]:
+        state["count"] = count
+        state["wake"].set()  # fetch the extra symbols now rather than next cycle
+    frame = state["frame"]
+
+wanted = set(symbols[:count])
+has_rows = bool(frame["symbol"].isin(wanted).any())
+
+# The frontend re-runs only this fragment on a timer - no sleeping on the script thread
+@st.fragment(run_every=refresh if has_rows else 1)
+def render_table():
+    with state["lock"]:
+        frame = state["frame"]
+    df = frame[frame["symbol"].isin(wanted)]
 
-# ─── Main Loop ─────────────────────────────────────────────────────────────────
-while True:
-    with placeholder.container():
+    if df.empty:
         st.info("Fetching data…")
-        rows = []
-        for sym in symbols[:count]:
-            stats = get_24h_stats(sym)
-            stats["chg1h"] = get_1h_change(sym)
-            rows.append(stats)
-            time.sleep(0.03)  # rate-limit friendly
+        return
+    if not has_rows:
+        st.rerun()  # first data arrived: rerun the app so the fragment switches to the refresh interval
 
-        df = pd.DataFrame(rows)
-        df["Signal"] = df.apply(compute_signals, axis=1)
-        df = df.sort_values("chg24h", ascending=False)
+    df = df.assign(Signal=compute_signals(df))
+    df = df.sort_values("chg24h", ascending=False)
 
-        st.dataframe(df[["symbol","lastPrice","chg1h","chg24h","vol24h","Signal"]],
-                     width=0, height=600)
+    st.dataframe(df[[*TABLE_COLUMNS, "Signal"]],
+                 width=0, height=600)
 
-    time.sleep(refresh)
+render_table()
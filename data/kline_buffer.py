@@ -0,0 +1,75 @@
+"""
+Fixed-size kline storage for MarketDataManager.
+
+Each (symbol, interval) keeps its candles in one preallocated NumPy
+structured array used as a ring buffer, so streaming updates overwrite a slot
+in place instead of appending dicts and re-slicing a Python list.
+"""
+
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from clients.binance_client import KLINE_FIELDS
+
+KLINE_DTYPE = np.dtype([(field, dtype) for field, dtype in KLINE_FIELDS])
+
+
+class KlineRingBuffer:
+    """
+    Ring buffer of the latest `capacity` klines in chronological order.
+
+    Indexing, slicing and iteration return np.record rows, which support
+    attribute access (`kline.close`) like the Kline tuples the REST client
+    returns, so signal code can read either.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._arr = np.zeros(capacity, dtype=KLINE_DTYPE).view(np.recarray)
+        self._head = 0  # slot the next new candle goes into
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _last_slot(self) -> int:
+        return (self._head - 1) % self.capacity
+
+    def last_timestamp(self) -> Optional[int]:
+        if not self._count:
+            return None
+        return int(self._arr.timestamp[self._last_slot()])
+
+    def upsert(self, kline: tuple) -> None:
+        """Overwrite the newest candle if it has the same open time, else append."""
+        if self._count and self.last_timestamp() == kline[0]:
+            self._arr[self._last_slot()] = kline
+            return
+        self._arr[self._head] = kline
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def load(self, klines: Iterable[tuple]) -> None:
+        """Replace the contents with `klines` (oldest first), keeping the newest `capacity`."""
+        rows = list(klines)[-self.capacity:]
+        self._count = len(rows)
+        self._head = self._count % self.capacity
+        if rows:
+            self._arr[:self._count] = np.array(rows, dtype=KLINE_DTYPE)
+
+    def to_array(self) -> np.recarray:
+        """Candles oldest first. A view until the buffer wraps, a copy after."""
+        if self._count < self.capacity:
+            return self._arr[:self._count]
+        return np.concatenate((self._arr[self._head:], self._arr[:self._head])).view(np.recarray)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(self.to_array())
+
+    def __getitem__(self, index):
+        return self.to_array()[index]
+
+    def __iter__(self) -> Iterator[np.record]:
+        return iter(self.to_array())
@@ -2,11 +2,14 @@ import asyncio
 import logging
 import time
 from typing import Dict, List, Optional, Callable
-from datetime import datetime, timedelta
+from datetime import timedelta
 import pandas as pd
 
-from clients.binance_client import BinanceDataClient
+from clients.binance_client import BinanceDataClient, Kline
 from clients.orion_client import OrionClient
+from data.kline_buffer import KlineRingBuffer
+from utils.helpers import submit_background
+from data.shared_market_cache import SharedMarketCache, TTL_TICKER, TTL_ORDERBOOK
 from config.settings import (
     CANDLE_INTERVALS, ORION_POLL_INTERVAL, MARKET_DATA_REFRESH_INTERVAL,
     ENABLE_WEBSOCKET, ENABLE_ORION_INTEGRATION
@@ -20,39 +23,70 @@ class MarketDataManager:
     def __init__(self):
         self.binance_client = BinanceDataClient()
         self.orion_client = OrionClient() if ENABLE_ORION_INTEGRATION else None
+        self.shared_cache = SharedMarketCache()
         
         # Data storage
         self.market_data = {}
-        self.klines_data = {}
+        self.klines_data = {}  # {symbol: {interval: KlineRingBuffer}}
+        self._max_klines = {interval: spec['limit'] for interval, spec in CANDLE_INTERVALS.items()}
         self.ticker_data = {}
         self.open_interest_data = {}
         self.funding_rates = {}
         
         # Callbacks for data updates
         self.data_callbacks = []
+        self._notify = self._compose_callbacks()
         
         # Control flags
         self.is_running = False
-        self.last_update = {}
+        self.last_update = {}  # data type -> time.monotonic_ns() of its last update
         
         logger.info("MarketDataManager initialized")
     
     def add_data_callback(self, callback: Callable):
         """Add a callback function to be called when new data arrives."""
         self.data_callbacks.append(callback)
+        self._notify = self._compose_callbacks()
     
     def remove_data_callback(self, callback: Callable):
         """Remove a callback function."""
         if callback in self.data_callbacks:
             self.data_callbacks.remove(callback)
+            self._notify = self._compose_callbacks()
+    
+    def _compose_callbacks(self) -> Callable[[str, Dict], None]:
+        """Fold the registered callbacks into one function, rebuilt only when the list changes."""
+        callbacks = tuple(self.data_callbacks)
+        if not callbacks:
+            return lambda data_type, data: None
+        if len(callbacks) == 1:
+            return callbacks[0]
+        
+        def notify_all(data_type: str, data: Dict):
+            for callback in callbacks:
+                callback(data_type, data)
+        return notify_all
     
     def _notify_callbacks(self, data_type: str, data: Dict):
         """Notify all registered callbacks of new data."""
-        for callback in self.data_callbacks:
-            try:
-                callback(data_type, data)
-            except Exception as e:
-                logger.error(f"Error in data callback: {e}")
+        try:
+            self._notify(data_type, data)
+        except Exception as e:
+            logger.error(f"Error in data callback: {e}")
+    
+    def _kline_buffer(self, symbol: str, interval: str) -> KlineRingBuffer:
+        """Get (or create) the ring buffer holding a symbol's klines for an interval."""
+        buffers = self.klines_data.setdefault(symbol, {})
+        if interval not in buffers:
+            buffers[interval] = KlineRingBuffer(self._max_klines.get(interval, 1000))
+        return buffers[interval]
+    
+    def get_klines_df(self, symbol: str, interval: str) -> pd.DataFrame:
+        """Get stored klines for a symbol and interval as a DataFrame, oldest first."""
+        buffer = self.klines_data.get(symbol, {}).get(interval)
+        if buffer is None:
+            return pd.DataFrame()
+        return buffer.to_dataframe()
     
     def get_perpetual_symbols(self) -> List[str]:
         """Get all available perpetual contract symbols."""
@@ -62,37 +96,42 @@ class MarketDataManager:
         """Fetch comprehensive market data for multiple symbols."""
         logger.info(f"Fetching market data for {len(symbols)} symbols")
         
-        market_data = {}
+        async def fetch_tickers(missing: List[str]) -> Dict[str, Dict]:
+            # one /ticker/24hr call covers every symbol
+            all_tickers = await asyncio.to_thread(self.binance_client.get_all_24h_tickers)
+            return {symbol: all_tickers[symbol] for symbol in missing if symbol in all_tickers}
         
-        # Fetch data in batches to avoid rate limits
-        batch_size = 50
-        for i in range(0, len(symbols), batch_size):
-            batch = symbols[i:i + batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}, symbols: {batch[:3]}...")  # Log first 3 symbols
-            
-            # Fetch 24h ticker data
-            for symbol in batch:
-                ticker_data = self.binance_client.get_24h_ticker(symbol)
-                if ticker_data:
-                    market_data[symbol] = ticker_data
-                    
-                    # Add additional data
-                    oi_data = self.binance_client.get_open_interest(symbol)
-                    if oi_data:
-                        market_data[symbol]['open_interest'] = oi_data
-                    
-                    funding_data = self.binance_client.get_funding_rate(symbol)
-                    if funding_data:
-                        market_data[symbol]['funding_rate'] = funding_data
-                else:
-                    logger.warning(f"No ticker data received for {symbol}")
+        async def fetch_funding(missing: List[str]) -> Dict[str, Dict]:
+            # one /premiumIndex call covers every symbol
+            all_funding = await asyncio.to_thread(self.binance_client.get_all_funding_rates)
+            return {symbol: all_funding[symbol] for symbol in missing if symbol in all_funding}
+        
+        async def fetch_open_interest(missing: List[str]) -> Dict[str, Dict]:
+            # no bulk endpoint - per-symbol requests run concurrently
+            return await self.binance_client.get_open_interest_bulk(missing)
+        
+        tickers, open_interest, funding = await asyncio.gather(
+            self.shared_cache.get_or_fetch_many("binance", "ticker", symbols, TTL_TICKER, fetch_tickers),
+            self.shared_cache.get_or_fetch_many("binance", "open_interest", symbols, TTL_TICKER, fetch_open_interest),
+            self.shared_cache.get_or_fetch_many("binance", "funding_rate", symbols, TTL_TICKER, fetch_funding)
+        )
+        
+        market_data = {}
+        for symbol in symbols:
+            ticker_data = tickers.get(symbol)
+            if not ticker_data:
+                logger.warning(f"No ticker data received for {symbol}")
+                continue
             
-            # Small delay between batches
-            await asyncio.sleep(0.1)
+            market_data[symbol] = dict(ticker_data)
+            if open_interest.get(symbol):
+                market_data[symbol]['open_interest'] = open_interest[symbol]
+            if funding.get(symbol):
+                market_data[symbol]['funding_rate'] = funding[symbol]
         
         # Store the data
         self.market_data.update(market_data)
-        self.last_update['market_data'] = datetime.now()
+        self.last_update['market_data'] = time.monotonic_ns()
         
         logger.info(f"Stored market data: {len(self.market_data)} total symbols in memory")
         
@@ -111,23 +150,19 @@ class MarketDataManager:
         
         klines_data = {}
         
-        for symbol in symbols:
-            symbol_klines = {}
+        for interval in intervals:
+            if interval not in CANDLE_INTERVALS:
+                continue
             
-            for interval in intervals:
-                if interval in CANDLE_INTERVALS:
-                    limit = CANDLE_INTERVALS[interval]['limit']
-                    klines = self.binance_client.get_klines(symbol, interval, limit)
-                    
-                    if klines:
-                        symbol_klines[interval] = klines
+            limit = CANDLE_INTERVALS[interval]['limit']
+            interval_klines = await self.binance_client.get_klines_bulk(symbols, interval, limit)
             
-            if symbol_klines:
-                klines_data[symbol] = symbol_klines
+            for symbol, klines in interval_klines.items():
+                if klines:
+                    klines_data.setdefault(symbol, {})[interval] = klines
+                    self._kline_buffer(symbol, interval).load(klines)
         
-        # Store the data
-        self.klines_data.update(klines_data)
-        self.last_update['klines_data'] = datetime.now()
+        self.last_update['klines_data'] = time.monotonic_ns()
         
         # Notify callbacks
         self._notify_callbacks('klines_data', klines_data)
@@ -143,10 +178,13 @@ class MarketDataManager:
         
         logger.info(f"Fetching Orion data for {len(symbols)} symbols")
         
-        orion_data = self.orion_client.get_aggregated_data(symbols)
+        orion_data = await self.shared_cache.get_or_fetch_many(
+            "orion", "aggregated", symbols, TTL_ORDERBOOK,
+            self.orion_client.get_aggregated_data_async
+        )
         
         # Store the data
-        self.last_update['orion_data'] = datetime.now()
+        self.last_update['orion_data'] = time.monotonic_ns()
         
         # Notify callbacks
         self._notify_callbacks('orion_data', orion_data)
@@ -160,55 +198,45 @@ class MarketDataManager:
         if symbol:
             # Update ticker data
             self.ticker_data[symbol] = data
-            self.last_update['ticker_data'] = datetime.now()
+            self.last_update['ticker_data'] = time.monotonic_ns()
             
             # Notify callbacks
             self._notify_callbacks('ticker_update', {symbol: data})
     
+    async def websocket_all_tickers_callback(self, tickers: List[Dict]):
+        """Callback for the all-market ticker stream: refresh the collected symbols' ticker fields."""
+        market_data = self.market_data
+        for ticker in tickers:
+            symbol = ticker['symbol']
+            self.ticker_data[symbol] = ticker
+            if symbol in market_data:
+                market_data[symbol].update(ticker)
+        
+        self.last_update['ticker_data'] = time.monotonic_ns()
+        self._notify_callbacks('ticker_update', {ticker['symbol']: ticker for ticker in tickers})
+    
     async def websocket_kline_callback(self, data: Dict):
         """Callback for WebSocket kline updates."""
         symbol = data.get('s')
         interval = data.get('k', {}).get('i')
         
         if symbol and interval:
-            # Update klines data
-            if symbol not in self.klines_data:
-                self.klines_data[symbol] = {}
-            
-            if interval not in self.klines_data[symbol]:
-                self.klines_data[symbol][interval] = []
-            
-            # Add new kline
-            kline_data = {
-                "timestamp": data['k']['t'],
-                "open": float(data['k']['o']),
-                "high": float(data['k']['h']),
-                "low": float(data['k']['l']),
-                "close": float(data['k']['c']),
-                "volume": float(data['k']['v']),
-                "close_time": data['k']['T'],
-                "quote_volume": float(data['k']['q']),
-                "trades": int(data['k']['n']),
-                "taker_buy_volume": float(data['k']['V']),
-                "taker_buy_quote_volume": float(data['k']['Q'])
-            }
-            
-            # Replace last kline if it's the same timestamp, otherwise append
-            if (self.klines_data[symbol][interval] and 
-                self.klines_data[symbol][interval][-1]['timestamp'] == kline_data['timestamp']):
-                self.klines_data[symbol][interval][-1] = kline_data
-            else:
-                self.klines_data[symbol][interval].append(kline_data)
+            k = data['k']
+            f = float
+            # Positional row in KLINE_FIELDS order - written straight into the ring slot
+            row = (
+                k['t'], f(k['o']), f(k['h']), f(k['l']), f(k['c']), f(k['v']),
+                k['T'], f(k['q']), int(k['n']), f(k['V']), f(k['Q'])
+            )
             
-            # Keep only the last N klines to prevent memory issues
-            max_klines = CANDLE_INTERVALS.get(interval, {}).get('limit', 1000)
-            if len(self.klines_data[symbol][interval]) > max_klines:
-                self.klines_data[symbol][interval] = self.klines_data[symbol][interval][-max_klines:]
+            # Overwrites the open candle in place, or appends into the next ring slot
+            self._kline_buffer(symbol, interval).upsert(row)
             
-            self.last_update['klines_data'] = datetime.now()
+            self.last_update['klines_data'] = time.monotonic_ns()
             
             # Notify callbacks
-            self._notify_callbacks('kline_update', {symbol: {interval: kline_data}})
+            if self.data_callbacks:
+                self._notify_callbacks('kline_update', {symbol: {interval: Kline._make(row)}})
     
     async def start_websocket_streams(self, symbols: List[str]):
         """Start WebSocket streams for real-time data."""
@@ -220,8 +248,9 @@ class MarketDataManager:
         
         await self.binance_client.start_websocket_streams(
             symbols,
-            ticker_callback=self.websocket_ticker_callback,
-            kline_callback=self.websocket_kline_callback
+            kline_callback=self.websocket_kline_callback,
+            # one !ticker@arr stream pushes every symbol's 24h ticker each second
+            all_tickers_callback=self.websocket_all_tickers_callback
         )
     
     def stop_websocket_streams(self):
@@ -293,7 +322,7 @@ class MarketDataManager:
     def get_data_age(self, data_type: str) -> Optional[timedelta]:
         """Get the age of the last update for a data type."""
         if data_type in self.last_update:
-            return datetime.now() - self.last_update[data_type]
+            return timedelta(microseconds=(time.monotonic_ns() - self.last_update[data_type]) // 1000)
         return None
     
     def export_to_dataframe(self, symbols: List[str] = None) -> pd.DataFrame:
@@ -311,11 +340,13 @@ class MarketDataManager:
         return pd.DataFrame(rows)
     
     def start_data_collection_sync(self, symbols: list):
-        """Synchronous wrapper to run async data collection in a thread."""
-        import asyncio
+        """
+        Start data collection on the shared background loop and wait for the initial fetch.
+        The periodic tasks and streams keep running on that loop after this returns.
+        """
         try:
             logger.info(f"Starting data collection for {len(symbols)} symbols")
-            asyncio.run(self.start_data_collection(symbols))
+            submit_background(self.start_data_collection(symbols)).result()
         except Exception as e:
             logger.error(f"Error in start_data_collection_sync: {e}")
             raise e 
\ No newline at end of file
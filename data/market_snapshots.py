@@ -0,0 +1,87 @@
+"""
+Market-wide snapshots for the main dashboard.
+
+Streamlit re-executes main_dashboard.py on every rerun, so caches defined in
+the script start empty each time. These fetchers live in an imported module
+instead: their swr_cached caches and single_flight guards persist for the
+whole process and are shared by every rerun and session.
+
+Each fetcher returns None when the upstream call failed or came back empty,
+so swr_cached keeps serving the last good snapshot instead of caching the
+fallback.
+"""
+
+import logging
+
+import orjson
+import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from clients._cache import swr_cached, single_flight
+from clients._ratelimit import RateLimitedSession, BINANCE_FUTURES_LIMITER
+from clients.coingecko import fetch_coingecko_data
+from clients.orion_cli import fetch_orion_data
+
+logger = logging.getLogger(__name__)
+
+TICKER_24H_URL = "https://fapi.binance.com/fapi/v1/ticker/24hr"
+TICKER_FLOAT_COLUMNS = ["lastPrice", "priceChangePercent", "volume", "quoteVolume", "highPrice", "lowPrice", "openPrice"]
+
+# one pooled keep-alive session for the snapshot requests, sharing the IP weight budget
+_SESSION = RateLimitedSession(BINANCE_FUTURES_LIMITER)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+
+@swr_cached(ttl=60, stale=300)  # Fresh for 1 minute, then served stale while refreshing in the background
+@single_flight  # concurrent sessions share one weight-40 request on a miss
+def get_all_24h_tickers():
+    """
+    Get 24h ticker data for every symbol in one request, as a DataFrame indexed by symbol.
+    None on failure, so a failed refresh keeps the cached tickers.
+    """
+    try:
+        response = _SESSION.get(TICKER_24H_URL, timeout=10, weight=40)
+        response.raise_for_status()
+
+        # Typed columns in one pass instead of float() per field per row
+        df = pd.DataFrame(orjson.loads(response.content), columns=["symbol", *TICKER_FLOAT_COLUMNS, "count"])
+        df = df.astype({**dict.fromkeys(TICKER_FLOAT_COLUMNS, "float64"), "count": "int64"})
+        if df.empty:
+            return None
+        return df.set_index("symbol", drop=False)
+    except Exception as e:
+        logger.error("Error fetching 24h tickers: %s", e)
+        return None
+
+
+@swr_cached(ttl=15, stale=60)
+@single_flight
+def get_orion_snapshot(symbols):
+    """
+    Orion data for `symbols` (a tuple, so it can key the cache).
+    None when Orion returned nothing, so a failed refresh keeps the cached snapshot.
+    """
+    try:
+        return fetch_orion_data(symbols) or None
+    except Exception as e:
+        logger.error("Error fetching Orion data: %s", e)
+        return None
+
+
+@swr_cached(ttl=60, stale=300)
+@single_flight
+def get_coingecko_snapshot(symbols):
+    """CoinGecko market cap and FDV per symbol; None when every value came back zero (the client's error fallback)."""
+    try:
+        data = fetch_coingecko_data(symbols)
+        if not any(v["market_cap"] or v["fdv"] for v in data.values()):
+            return None
+        return data
+    except Exception as e:
+        logger.error("Error fetching CoinGecko data: %s", e)
+        return None
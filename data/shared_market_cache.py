@@ -0,0 +1,149 @@
+"""
+Cross-process cache for exchange responses, backed by Redis.
+
+Every Streamlit worker and MarketDataManager otherwise keeps its own copy of
+the same tickers and issues the same upstream requests. Values are stored as
+JSON under `shared:market:{exchange}:{symbol}:{field}` with short TTLs, so
+whichever process fetches first serves the rest until the entry expires.
+
+Redis is optional: without the `redis` package or REDIS_URL the cache is a
+pass-through and every call goes upstream as before.
+"""
+
+import inspect
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import orjson
+
+from config.settings import REDIS_URL
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis is an optional dependency
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "shared:market"
+INVALIDATE_CHANNEL = f"{KEY_PREFIX}:invalidate"
+
+# Seconds each kind of value stays shared
+TTL_OHLCV = 60
+TTL_TICKER = 10
+TTL_ORDERBOOK = 5
+
+
+class SharedMarketCache:
+    """Redis-backed get-or-fetch cache with per-namespace hit/miss counters."""
+
+    def __init__(self, url: Optional[str] = REDIS_URL):
+        self._redis = None
+        if url and aioredis is not None:
+            self._redis = aioredis.from_url(url)
+            logger.info("Shared market cache enabled")
+        elif url:
+            logger.warning("REDIS_URL is set but the redis package is not installed - shared cache disabled")
+
+        self.hits = Counter()
+        self.misses = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self._redis is not None
+
+    @staticmethod
+    def _key(namespace: str, key: str) -> str:
+        return f"{KEY_PREFIX}:{namespace}:{key}"
+
+    @staticmethod
+    async def _call(fetcher: Callable, *args) -> Any:
+        """Call a sync or async fetcher and return its result."""
+        value = fetcher(*args)
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    async def get_or_fetch(self, namespace: str, key: str, ttl: int,
+                           fetcher: Callable[[], Any]) -> Any:
+        """Return the shared value for `key`, calling `fetcher` and storing its result on a miss."""
+        if self._redis is None:
+            return await self._call(fetcher)
+
+        full_key = self._key(namespace, key)
+        try:
+            raw = await self._redis.get(full_key)
+        except Exception as e:
+            logger.warning(f"Shared cache read failed for {full_key}: {e}")
+            raw = None
+
+        if raw is not None:
+            self.hits[namespace] += 1
+            return orjson.loads(raw)
+
+        self.misses[namespace] += 1
+        value = await self._call(fetcher)
+        if value is not None:
+            try:
+                # NX: if another process stored it first, keep theirs
+                await self._redis.set(full_key, orjson.dumps(value), ex=ttl, nx=True)
+            except Exception as e:
+                logger.warning(f"Shared cache write failed for {full_key}: {e}")
+        return value
+
+    async def get_or_fetch_many(self, namespace: str, field: str, symbols: List[str], ttl: int,
+                                fetcher: Callable[[List[str]], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Bulk variant of get_or_fetch keyed `{symbol}:{field}`.
+        `fetcher` gets only the symbols that missed and returns {symbol: value}.
+        """
+        if self._redis is None or not symbols:
+            return await self._call(fetcher, symbols)
+
+        keys = [self._key(namespace, f"{symbol}:{field}") for symbol in symbols]
+        try:
+            raws = await self._redis.mget(keys)
+        except Exception as e:
+            logger.warning(f"Shared cache read failed for {namespace}:*:{field}: {e}")
+            raws = [None] * len(keys)
+
+        results = {symbol: orjson.loads(raw) for symbol, raw in zip(symbols, raws) if raw is not None}
+        missing = [symbol for symbol in symbols if symbol not in results]
+        self.hits[namespace] += len(results)
+        self.misses[namespace] += len(missing)
+
+        if missing:
+            fetched = await self._call(fetcher, missing) or {}
+            results.update(fetched)
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for symbol, value in fetched.items():
+                        if value is not None:
+                            pipe.set(self._key(namespace, f"{symbol}:{field}"), orjson.dumps(value), ex=ttl, nx=True)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Shared cache write failed for {namespace}:*:{field}: {e}")
+
+        return results
+
+    async def invalidate(self, namespace: str, key: str) -> None:
+        """Drop a shared entry and tell subscribers it changed."""
+        if self._redis is None:
+            return
+        full_key = self._key(namespace, key)
+        try:
+            await self._redis.delete(full_key)
+            await self._redis.publish(INVALIDATE_CHANNEL, full_key)
+        except Exception as e:
+            logger.warning(f"Shared cache invalidation failed for {full_key}: {e}")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counts per namespace since startup."""
+        namespaces = set(self.hits) | set(self.misses)
+        return {ns: {"hits": self.hits[ns], "misses": self.misses[ns]} for ns in sorted(namespaces)}
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
@@ -4,7 +4,17 @@ Debug script to check Binance API response structure.
 """
 
 import requests
-import json
+import orjson
+
+# keep-alive session so repeated checks reuse one TLS connection
+SESSION = requests.Session()
+
+MAX_VALUE_CHARS = 80  # longest value preview printed per field
+
+def _preview(value):
+    """String form of a value, cut to MAX_VALUE_CHARS."""
+    text = str(value)
+    return text if len(text) <= MAX_VALUE_CHARS else text[:MAX_VALUE_CHARS] + "…"
 
 def debug_binance_api():
     """Debug the Binance API response structure."""
@@ -14,20 +24,20 @@ def debug_binance_api():
     params = {"symbol": "BTCUSDT"}
     
     try:
-        response = requests.get(url, params=params)
+        response = SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
         
-        data = response.json()
+        data = orjson.loads(response.content)
         
         print("🔍 Binance API Response Structure:")
         print("=" * 50)
-        print(json.dumps(data, indent=2))
+        print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
         print("=" * 50)
         
         # Check which fields are actually present
         print("\n📊 Available fields:")
         for key, value in data.items():
-            print(f"  {key}: {type(value).__name__} = {value}")
+            print(f"  {key}: {type(value).__name__} = {_preview(value)}")
         
         # Test which fields might be missing
         required_fields = [
@@ -1,18 +1,24 @@
 import streamlit as st
-import requests
 import pandas as pd
+import numpy as np
 import time
-from datetime import datetime
 import logging
 import asyncio
-import threading
-import json
+import aiohttp
+import orjson
 import os
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from clients._ratelimit import RateLimitedSession, BINANCE_FUTURES_LIMITER, klines_weight
+from config.settings import HTTP_USER_AGENT
 from clients.ws_client import WebSocketClient
-from clients.orion_cli import fetch_orion_data, test_orion_cli
-from clients.binance import get_btc_correlation
-from clients.coingecko import fetch_coingecko_data
-from signals.basic import compute_comprehensive_signals
+from clients.orion_cli import test_orion_cli
+from clients.binance import get_btc_correlations
+from data.market_snapshots import get_all_24h_tickers, get_orion_snapshot, get_coingecko_snapshot
+from signals.basic import compute_comprehensive_signals_frame
+from utils.helpers import run_async, submit_background
 
 # Add chatbot imports
 import sys
@@ -23,16 +29,27 @@ from mentorship.embed_store import ingest_transcript, query_store, get_store_sta
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize WebSocket queue and tick storage
-if 'tick_queue' not in st.session_state:
-    st.session_state.tick_queue = None
+# Initialize WebSocket client and tick storage
+if 'ws_client' not in st.session_state:
+    st.session_state.ws_client = None
     
+# Latest tick per WebSocket symbol; tick_index maps a symbol to its row
+TICK_DTYPE = np.dtype([("price", "f8"), ("qty", "f8"), ("ts", "u8")])
 if 'ticks' not in st.session_state:
-    st.session_state.ticks = {}
+    st.session_state.ticks = np.zeros(0, dtype=TICK_DTYPE)
+    st.session_state.tick_index = {}
     
 if 'ws_started' not in st.session_state:
     st.session_state.ws_started = False
 
+if 'ws_task' not in st.session_state:
+    st.session_state.ws_task = None
+
+# One row per symbol: open time of its current 1h candle (seconds) and the close before it
+PRICE_SNAPSHOT_COLUMNS = ["open_time", "price"]
+if 'price_snapshot_1h' not in st.session_state:
+    st.session_state.price_snapshot_1h = pd.DataFrame(columns=PRICE_SNAPSHOT_COLUMNS, dtype=float)
+
 # Page config
 st.set_page_config(
     page_title="JumpTrader - AI Trading Dashboard",
@@ -46,24 +63,31 @@ RATIO_CACHE_PATH = "data/ratio_cache.json"
 SPIKE_THRESHOLD = 10  # percent points for ratio spike detection
 
 # Load previous ratios if file exists
+@st.cache_resource  # One dict per process, shared by every rerun and session; reruns re-execute this script
 def load_previous_ratios():
-    """Load previous Circ/FDV ratios from cache file."""
+    """Load previous Circ/FDV ratios, reading the cache file only once per process."""
     try:
         if os.path.exists(RATIO_CACHE_PATH):
-            with open(RATIO_CACHE_PATH, "r") as f:
-                return json.load(f)
+            with open(RATIO_CACHE_PATH, "rb") as f:
+                return orjson.loads(f.read())
     except Exception as e:
-        logger.error(f"Error loading ratio cache: {e}")
+        logger.error("Error loading ratio cache: %s", e)
     return {}
 
 def save_current_ratios(ratios):
-    """Save current Circ/FDV ratios to cache file."""
+    """Save current Circ/FDV ratios to cache file, skipping the write when nothing changed."""
+    saved = load_previous_ratios()
+    if ratios == saved:
+        return
     try:
         os.makedirs(os.path.dirname(RATIO_CACHE_PATH), exist_ok=True)
-        with open(RATIO_CACHE_PATH, "w") as f:
-            json.dump(ratios, f, indent=2)
+        with open(RATIO_CACHE_PATH, "wb") as f:
+            f.write(orjson.dumps(ratios, option=orjson.OPT_INDENT_2))
+        # keep the shared mirror in step with the file
+        saved.clear()
+        saved.update(ratios)
     except Exception as e:
-        logger.error(f"Error saving ratio cache: {e}")
+        logger.error("Error saving ratio cache: %s", e)
 
 def detect_ratio_spike(current_ratio, previous_ratio, threshold=SPIKE_THRESHOLD):
     """Detect if there's a significant change in the Circ/FDV ratio."""
@@ -79,165 +103,223 @@ def detect_ratio_spike(current_ratio, previous_ratio, threshold=SPIKE_THRESHOLD)
 # Binance API endpoints
 BINANCE_BASE_URL = "https://fapi.binance.com"
 EXCHANGE_INFO_URL = f"{BINANCE_BASE_URL}/fapi/v1/exchangeInfo"
-TICKER_24H_URL = f"{BINANCE_BASE_URL}/fapi/v1/ticker/24hr"
 KLINES_URL = f"{BINANCE_BASE_URL}/fapi/v1/klines"
+EXCHANGE_INFO_CACHE_PATH = "data/exchange_info_cache.json"
+SYMBOL_FIELDS = itemgetter("symbol", "contractType", "status")  # one C call per exchangeInfo entry
+
+@st.cache_resource  # Built once per process - a module-level session would be rebuilt (and its pool dropped) every rerun
+def get_session():
+    """One pooled keep-alive session for every REST call on this page, sharing the IP weight budget."""
+    session = RateLimitedSession(BINANCE_FUTURES_LIMITER)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+    ))
+    return session
+
+def load_exchange_info_cache():
+    """Load the cached {etag, last_modified, symbols} for exchangeInfo."""
+    try:
+        if os.path.exists(EXCHANGE_INFO_CACHE_PATH):
+            with open(EXCHANGE_INFO_CACHE_PATH, "rb") as f:
+                return orjson.loads(f.read())
+    except Exception as e:
+        logger.error("Error loading exchangeInfo cache: %s", e)
+    return {}
+
+def save_exchange_info_cache(cache):
+    """Save the exchangeInfo validators and symbol list."""
+    try:
+        os.makedirs(os.path.dirname(EXCHANGE_INFO_CACHE_PATH), exist_ok=True)
+        with open(EXCHANGE_INFO_CACHE_PATH, "wb") as f:
+            f.write(orjson.dumps(cache))
+    except Exception as e:
+        logger.error("Error saving exchangeInfo cache: %s", e)
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@st.cache_resource(ttl=3600)  # One tuple shared by every session; conditional requests re-validate hourly
 def get_perpetual_symbols():
-    """Get all perpetual trading symbols from Binance."""
+    """Get all perpetual trading symbols from Binance, re-downloading exchangeInfo only when it changed."""
+    cache = load_exchange_info_cache()
+    headers = {}
+    if cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+    if cache.get("last_modified"):
+        headers["If-Modified-Since"] = cache["last_modified"]
+    
     try:
-        response = requests.get(EXCHANGE_INFO_URL, timeout=10)
+        response = get_session().get(EXCHANGE_INFO_URL, headers=headers, timeout=10)
+        if response.status_code == 304 and cache.get("symbols"):
+            logger.info("exchangeInfo unchanged, using %d cached symbols", len(cache['symbols']))
+            return tuple(cache["symbols"])
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         symbols = [
-            symbol["symbol"] for symbol in data["symbols"]
-            if symbol["contractType"] == "PERPETUAL" and symbol["status"] == "TRADING"
+            symbol for symbol, contract_type, status in map(SYMBOL_FIELDS, data["symbols"])
+            if contract_type == "PERPETUAL" and status == "TRADING"
         ]
-        logger.info(f"Found {len(symbols)} perpetual symbols")
-        return symbols
+        save_exchange_info_cache({
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "symbols": symbols
+        })
+        logger.info("Found %d perpetual symbols", len(symbols))
+        return tuple(symbols)
     except Exception as e:
-        logger.error(f"Error fetching symbols: {e}")
-        return []
+        logger.error("Error fetching symbols: %s", e)
+        return tuple(cache.get("symbols", ()))
+
+def _reference_from_klines(data):
+    """(open time in seconds, previous close) of the current candle in a limit=2 klines response."""
+    if len(data) >= 2:
+        return data[1][0] / 1000, float(data[0][4])
+    return None
 
-@st.cache_data(ttl=60)  # Cache for 1 minute
-def get_24h_ticker_data(symbol):
-    """Get 24h ticker data for a symbol."""
+async def fetch_klines(session, semaphore, symbol, interval="1h", limit=2):
+    """Fetch raw klines for one symbol."""
+    params = {
+        "symbol": symbol,
+        "interval": interval,
+        "limit": limit
+    }
     try:
-        response = requests.get(f"{TICKER_24H_URL}?symbol={symbol}", timeout=5)
-        response.raise_for_status()
-        data = response.json()
-        
-        return {
-            "symbol": symbol,
-            "lastPrice": float(data.get("lastPrice", 0)),
-            "priceChangePercent": float(data.get("priceChangePercent", 0)),
-            "volume": float(data.get("volume", 0)),
-            "quoteVolume": float(data.get("quoteVolume", 0)),
-            "highPrice": float(data.get("highPrice", 0)),
-            "lowPrice": float(data.get("lowPrice", 0)),
-            "openPrice": float(data.get("openPrice", 0)),
-            "count": int(data.get("count", 0))
-        }
+        async with semaphore:
+            await BINANCE_FUTURES_LIMITER.acquire_async(klines_weight(limit))
+            async with session.get(KLINES_URL, params=params) as response:
+                BINANCE_FUTURES_LIMITER.update(response.headers, response.status)
+                response.raise_for_status()
+                return orjson.loads(await response.read())
     except Exception as e:
-        logger.error(f"Error fetching ticker for {symbol}: {e}")
-        return None
+        logger.error("Error fetching klines for %s: %s", symbol, e)
+        return []
+
+async def gather_klines(symbols, interval="1h", limit=2):
+    """Fetch klines for all symbols concurrently over one pooled session."""
+    # 20 in flight keeps the burst well inside Binance's weight limit
+    semaphore = asyncio.Semaphore(20)
+    timeout = aiohttp.ClientTimeout(total=5)
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=50), timeout=timeout,
+                                     headers={"User-Agent": HTTP_USER_AGENT}) as session:
+        results = await asyncio.gather(*[
+            fetch_klines(session, semaphore, symbol, interval, limit) for symbol in symbols
+        ])
+    return dict(zip(symbols, results))
 
-@st.cache_data(ttl=60)  # Cache for 1 minute
-def get_klines_data(symbol, interval="1h", limit=2):
-    """Get klines/candlestick data for a symbol."""
+def get_hourly_reference_prices(symbols):
+    """Get each symbol's candle open time and previous close from concurrently fetched 1h klines."""
     try:
-        params = {
-            "symbol": symbol,
-            "interval": interval,
-            "limit": limit
-        }
-        response = requests.get(KLINES_URL, params=params, timeout=5)
-        response.raise_for_status()
-        data = response.json()
-        
-        if len(data) >= 2:
-            prev_close = float(data[0][4])  # Previous close
-            last_close = float(data[1][4])  # Current close
-            change_1h = ((last_close - prev_close) / prev_close) * 100
-            return change_1h
-        return 0.0
+        klines = run_async(gather_klines(list(symbols), "1h", 2))
     except Exception as e:
-        logger.error(f"Error fetching klines for {symbol}: {e}")
-        return 0.0
+        logger.error("Error fetching klines: %s", e)
+        klines = {}
+    references = {symbol: _reference_from_klines(data) for symbol, data in klines.items()}
+    return pd.DataFrame.from_dict(
+        {symbol: ref for symbol, ref in references.items() if ref is not None},
+        orient="index", columns=PRICE_SNAPSHOT_COLUMNS, dtype=float
+    )
 
-def compute_signals(row):
-    """Compute trading signals based on data."""
-    signals = []
-    
-    # Volume spike signal
-    if row["quoteVolume"] > 500_000_000:  # 500M volume
-        signals.append("🔥 Volume Spike")
-    
-    # 1h momentum signal
-    if row["change_1h"] > 3:
-        signals.append("📈 1H Bullish")
-    elif row["change_1h"] < -3:
-        signals.append("📉 1H Bearish")
-    
-    # 24h volatility signal
-    if abs(row["priceChangePercent"]) > 10:
-        signals.append("⚠️ High Volatility")
-    
-    # Price action signals
-    if row["lastPrice"] > row["highPrice"] * 0.99:
-        signals.append("🚀 Near High")
-    elif row["lastPrice"] < row["lowPrice"] * 1.01:
-        signals.append("📉 Near Low")
-    
-    # Real-time tick signals
-    if "last_tick_price" in row and row["last_tick_price"] and row["last_tick_price"] > 0:
-        tick_change = ((row["last_tick_price"] - row["lastPrice"]) / row["lastPrice"]) * 100
-        if abs(tick_change) > 0.5:  # 0.5% tick change
-            signals.append("⚡ Tick Spike")
-    
-    return ", ".join(signals) if signals else "-"
+def get_1h_changes(symbols, tickers):
+    """
+    1h change per symbol: last price against the close before the current 1h candle.
+    Reference prices are kept in session state and only refetched once the hour
+    rolls over, so most refreshes need no klines requests at all.
+    """
+    snapshot = st.session_state.price_snapshot_1h
+    now = time.time()
+    hour_start = now - now % 3600
+    
+    # missing symbols reindex to NaN, which fails the comparison and counts as stale
+    open_time = snapshot["open_time"].reindex(symbols)
+    stale = open_time.index[~(open_time >= hour_start)]
+    if len(stale):
+        logger.info("Refreshing 1h reference prices for %d symbols", len(stale))
+        snapshot = get_hourly_reference_prices(stale).combine_first(snapshot)
+        st.session_state.price_snapshot_1h = snapshot
+    
+    current = tickers["lastPrice"].reindex(symbols)
+    reference = snapshot["price"].reindex(symbols)
+    return ((current - reference) / reference * 100).replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+# Signal tags in bit order; compute_signal_codes packs each row's tags into one code
+SIGNAL_LABELS = [
+    "🔥 Volume Spike",
+    "📈 1H Bullish",
+    "📉 1H Bearish",
+    "⚠️ High Volatility",
+    "🚀 Near High",
+    "📉 Near Low",
+    "⚡ Tick Spike",
+]
+SIGNAL_FLAGS = {label: 1 << bit for bit, label in enumerate(SIGNAL_LABELS)}
+# Display string for every possible code, so no string work happens per row
+SIGNAL_STRINGS = np.array([
+    ", ".join(label for bit, label in enumerate(SIGNAL_LABELS) if code >> bit & 1) or "-"
+    for code in range(1 << len(SIGNAL_LABELS))
+], dtype=object)
+
+def compute_signal_codes(df):
+    """Compute trading signals for every row at once as a uint8 bitmask (bit order of SIGNAL_LABELS)."""
+    last_price = df["lastPrice"].to_numpy()
+    change_1h = df["change_1h"].to_numpy()
+    near_high = last_price > df["highPrice"].to_numpy() * 0.99
+    tick_price = df["last_tick_price"].fillna(0.0).to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tick_change = (tick_price - last_price) / last_price * 100
+    
+    masks = [
+        df["quoteVolume"].to_numpy() > 500_000_000,  # 500M volume
+        change_1h > 3,
+        change_1h < -3,
+        np.abs(df["priceChangePercent"].to_numpy()) > 10,
+        near_high,
+        ~near_high & (last_price < df["lowPrice"].to_numpy() * 1.01),
+        (tick_price > 0) & (np.abs(tick_change) > 0.5),  # 0.5% tick change
+    ]
+    codes = np.zeros(len(df), dtype=np.uint8)
+    for bit, mask in enumerate(masks):
+        codes |= mask.astype(np.uint8) << bit
+    return codes
 
 def start_websocket_client(symbols):
-    """Start WebSocket client in a separate thread."""
+    """Start the WebSocket client on the background event loop."""
     if not st.session_state.ws_started:
         try:
             # Use the provided symbols (already sorted by tickCount)
             ws_symbols = symbols[:10]  # Limit to top 10 for WebSocket performance
-            # Create queue in the thread with event loop
-            if st.session_state.tick_queue is None:
-                st.session_state.tick_queue = asyncio.Queue()
-            client = WebSocketClient(ws_symbols, st.session_state.tick_queue)
-            
-            def run_websocket():
-                # Create a new event loop for this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(client.run())
-                except Exception as e:
-                    logger.error(f"WebSocket error: {e}")
-                finally:
-                    loop.close()
+            client = WebSocketClient(ws_symbols)
+            st.session_state.tick_index = {symbol: i for i, symbol in enumerate(ws_symbols)}
+            st.session_state.ticks = np.zeros(len(ws_symbols), dtype=TICK_DTYPE)
             
-            thread = threading.Thread(target=run_websocket, daemon=True)
-            thread.start()
+            # Runs on the shared background loop rather than a thread + loop per client
+            st.session_state.ws_task = submit_background(client.run())
             st.session_state.ws_started = True
             st.session_state.ws_client = client
-            logger.info(f"WebSocket client started for {len(ws_symbols)} symbols")
+            logger.info("WebSocket client started for %d symbols", len(ws_symbols))
         except Exception as e:
-            logger.error(f"Failed to start WebSocket client: {e}")
+            logger.error("Failed to start WebSocket client: %s", e)
 
 def consume_ticks():
-    """Consume ticks from the queue and update session state."""
+    """Consume buffered ticks from the WebSocket client and update session state."""
     try:
-        if st.session_state.tick_queue is not None:
-            while not st.session_state.tick_queue.empty():
-                tick = st.session_state.tick_queue.get_nowait()
-                sym = tick["symbol"]
-                st.session_state.ticks[sym] = {
-                    "last_tick_price": tick["price"],
-                    "tick_volume": tick["qty"],
-                    "tick_timestamp": tick["timestamp"]
-                }
+        if st.session_state.ws_client is not None:
+            # Each tick overwrites its symbol's row in place, so the newest one wins
+            index = st.session_state.tick_index
+            ticks = st.session_state.ticks
+            for tick in st.session_state.ws_client.drain():
+                i = index.get(tick.symbol)
+                if i is not None:
+                    ticks[i] = (tick.price, tick.qty, tick.timestamp)
     except Exception as e:
-        logger.error(f"Error consuming ticks: {e}")
+        logger.error("Error consuming ticks: %s", e)
 
-@st.cache_data(ttl=15)
-def get_orion_snapshot(symbols=None):
+def safe_btc_correlations(symbols):
+    """BTC correlation per symbol (BTC closes fetched once), all 0.0 if they can't be computed."""
     try:
-        return fetch_orion_data(symbols)
+        return get_btc_correlations(symbols)
     except Exception as e:
-        logger.error(f"Error fetching Orion data: {e}")
-        return {}
-
-@st.cache_data(ttl=60)
-def get_coingecko_snapshot(symbols):
-    try:
-        return fetch_coingecko_data(symbols)
-    except Exception as e:
-        logger.error(f"Error fetching CoinGecko data: {e}")
-        return {}
+        logger.error("Error computing BTC correlations: %s", e)
+        return [0.0] * len(symbols)
 
 def get_market_data(symbol_limit=10, spike_threshold=10):
     """
@@ -255,39 +337,37 @@ def get_market_data(symbol_limit=10, spike_threshold=10):
     if not symbols:
         return pd.DataFrame()
     
-    # Test and fetch Orion CLI data for all symbols first
-    orion_available = test_orion_cli()
+    # Test and fetch Orion CLI data for all symbols first; None if it has never returned data
+    orion_data = get_orion_snapshot(symbols) if test_orion_cli() else None
     
-    if orion_available:
-        # Fetch Orion data for all symbols to get tickCount for sorting
-        orion_data = get_orion_snapshot(symbols)
+    if orion_data is not None:
+        # Orion data for all symbols gives the tickCount for sorting
         st.session_state.orion_data = orion_data
-        logger.info(f"Orion CLI data loaded: {len(orion_data)} symbols")
+        logger.debug("Orion CLI data loaded: %d symbols", len(orion_data))
         
-        # Filter symbols to only those with Orion data and tickCount > 0
-        symbols_with_orion = [
-            s for s in symbols 
-            if s in orion_data and orion_data[s].get("tickCount", 0) > 0
-        ]
+        # tickCount per symbol with Orion data and tickCount > 0, read once so sorting is plain dict lookups
+        tick_counts = {}
+        for s in symbols:
+            record = orion_data.get(s)
+            if record is not None:
+                count = record.get("tickCount", 0)
+                if count > 0:
+                    tick_counts[s] = count
         
         # Sort symbols by tickCount from Orion data, descending
-        symbols_sorted = sorted(
-            symbols_with_orion,
-            key=lambda s: orion_data[s].get("tickCount", 0),
-            reverse=True
-        )
+        symbols_sorted = sorted(tick_counts, key=tick_counts.__getitem__, reverse=True)
         
         # Select top N symbols by tickCount
         top_symbols = symbols_sorted[:symbol_limit]
-        logger.info(f"Selected top {len(top_symbols)} symbols by tickCount from {len(symbols_with_orion)} available")
+        logger.debug("Selected top %d symbols by tickCount from %d available", len(top_symbols), len(tick_counts))
         
         # Log the selected symbols and their tickCounts for debugging
-        for i, symbol in enumerate(top_symbols):
-            tick_count = orion_data[symbol].get("tickCount", 0)
-            logger.info(f"  {i+1}. {symbol}: {tick_count} ticks")
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, symbol in enumerate(top_symbols):
+                logger.debug("  %d. %s: %s ticks", i + 1, symbol, tick_counts[symbol])
     else:
         st.session_state.orion_data = {}
-        logger.warning("Orion CLI not available, using first N symbols")
+        logger.warning("Orion CLI data not available, using first N symbols")
         top_symbols = symbols[:symbol_limit]
     
     # Start WebSocket client for real-time ticks with top symbols
@@ -297,145 +377,183 @@ def get_market_data(symbol_limit=10, spike_threshold=10):
     consume_ticks()
     
     # Fetch CoinGecko data for the selected symbols
-    coingecko = get_coingecko_snapshot(top_symbols)
-    
-    # Load previous ratios for spike detection
-    previous_ratios = load_previous_ratios()
-    current_ratios = {}
-    
-    market_data = []
-    
-    for i, symbol in enumerate(top_symbols):
-        logger.info(f"Processing symbol {i+1}/{len(top_symbols)}: {symbol}")
-        
-        try:
-            # Get ticker data
-            logger.info(f"Fetching ticker data for {symbol}")
-            ticker_data = get_24h_ticker_data(symbol)
-            if not ticker_data:
-                logger.warning(f"No ticker data for {symbol}, skipping")
-                continue
-                
-            # Get 1h change
-            logger.info(f"Fetching 1h change for {symbol}")
-            change_1h = get_klines_data(symbol, "1h", 2)
-            
-            # Get real-time tick data
-            tick_info = st.session_state.ticks.get(symbol, {})
-            last_tick_price = tick_info.get("last_tick_price", 0.0)
-            tick_volume = tick_info.get("tick_volume", 0.0)
-            
-            # Ensure numeric values
-            try:
-                last_tick_price = float(last_tick_price) if last_tick_price else 0.0
-                tick_volume = float(tick_volume) if tick_volume else 0.0
-            except (ValueError, TypeError):
-                last_tick_price = 0.0
-                tick_volume = 0.0
-            
-            # Get Orion CLI data
-            orion_info = st.session_state.orion_data.get(symbol, {})
-            tick_count = orion_info.get("tickCount", 0)
-            funding_rate = float(orion_info.get("fundingRate", 0))
-            open_interest = float(orion_info.get("openInterest", 0))
-            
-            # Get BTC correlation
-            logger.info(f"Fetching BTC correlation for {symbol}")
-            btc_corr = get_btc_correlation(symbol)
-            
-            # Get CoinGecko data
-            cg = coingecko.get(symbol, {})
-            mcap = cg.get("market_cap", 0.0)
-            fdv = cg.get("fdv", 0.0)
-            
-            # Calculate circulating market cap vs. FDV ratio
-            ratio = (mcap / fdv) if fdv > 0 else 0.0
-            
-            # Store current ratio for cache
-            current_ratios[symbol] = ratio
-            
-            # Detect ratio spike
-            prev_ratio = previous_ratios.get(symbol)
-            ratio_spike = detect_ratio_spike(ratio, prev_ratio, spike_threshold)
-            
-            # Combine data
-            row_data = {
-                **ticker_data,
-                "change_1h": change_1h,
-                "btc_corr": btc_corr,
-                "last_tick_price": last_tick_price,
-                "tick_volume": tick_volume,
-                "tickCount": tick_count,
-                "fundingRate": funding_rate,
-                "openInterest": open_interest,
-                "cg_market_cap": mcap,
-                "cg_fdv": fdv,
-                "circ_fdv_ratio": ratio,
-                "ratio_spike": ratio_spike
-            }
-            
-            # Compute signals
-            row_data["signals"] = compute_signals(row_data)
-            
-            market_data.append(row_data)
-            logger.info(f"Successfully processed {symbol}")
-            
-        except Exception as e:
-            logger.error(f"Error processing {symbol}: {e}")
-            continue
-        
-        # Minimal delay for faster loading with fewer symbols
-        time.sleep(0.01)
+    coingecko = get_coingecko_snapshot(tuple(top_symbols))
+    
+    # One request covers every symbol's 24h stats; rows follow top_symbols (tickCount order)
+    tickers = get_all_24h_tickers()
+    if tickers is None:
+        return pd.DataFrame(), pd.DataFrame()
+    missing = [s for s in top_symbols if s not in tickers.index]
+    if missing:
+        logger.warning("No ticker data for %s, skipping", missing)
+    df = tickers.loc[[s for s in top_symbols if s in tickers.index]].reset_index(drop=True)
+    if df.empty:
+        return pd.DataFrame(), pd.DataFrame()
+    selected = df["symbol"]
+    
+    def lookup(source, key, default=0.0):
+        """One numeric column from a {symbol: {key: value}} mapping."""
+        values = selected.map(lambda s: source.get(s, {}).get(key, default))
+        return pd.to_numeric(values, errors="coerce").fillna(default)
+    
+    # BTC correlations are blocking fetches - overlap them with the 1h klines
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        btc_corr = pool.submit(safe_btc_correlations, selected.tolist())
+        df["change_1h"] = selected.map(get_1h_changes(selected.tolist(), tickers)).fillna(0.0)
+        df["btc_corr"] = btc_corr.result()
+    
+    # Real-time tick data
+    ticks = st.session_state.ticks
+    rows = np.fromiter((st.session_state.tick_index.get(s, -1) for s in selected), dtype=np.intp, count=len(selected))
+    has_tick = rows >= 0
+    df["last_tick_price"] = 0.0
+    df["tick_volume"] = 0.0
+    df.loc[has_tick, "last_tick_price"] = ticks["price"][rows[has_tick]]
+    df.loc[has_tick, "tick_volume"] = ticks["qty"][rows[has_tick]]
+    
+    # Orion CLI data
+    df["tickCount"] = lookup(st.session_state.orion_data, "tickCount", 0).astype(int)
+    df["fundingRate"] = lookup(st.session_state.orion_data, "fundingRate")
+    df["openInterest"] = lookup(st.session_state.orion_data, "openInterest")
+    
+    # CoinGecko data and circulating market cap vs. FDV ratio
+    df["cg_market_cap"] = lookup(coingecko or {}, "market_cap")
+    df["cg_fdv"] = lookup(coingecko or {}, "fdv")
+    df["circ_fdv_ratio"] = (df["cg_market_cap"] / df["cg_fdv"].where(df["cg_fdv"] > 0)).fillna(0.0)
+    
+    # Detect ratio spikes against the previous run, then save the current ratios for the next one.
+    # Without CoinGecko data every ratio is 0, so leave the saved baseline alone.
+    if coingecko is None:
+        df["ratio_spike"] = None
+    else:
+        previous_ratios = load_previous_ratios()
+        current_ratios = dict(zip(selected.tolist(), df["circ_fdv_ratio"].tolist()))
+        df["ratio_spike"] = [
+            detect_ratio_spike(ratio, previous_ratios.get(symbol), spike_threshold)
+            for symbol, ratio in current_ratios.items()
+        ]
+        save_current_ratios(current_ratios)
     
-    # Save current ratios for next comparison
-    save_current_ratios(current_ratios)
+    # Keep the bitmask so signal counts are a bit-AND (e.g. codes & SIGNAL_FLAGS["⚡ Tick Spike"])
+    df["signal_bits"] = compute_signal_codes(df)
+    df["signals"] = SIGNAL_STRINGS[df["signal_bits"].to_numpy()]
     
-    if market_data:
-        # Convert to DataFrame
-        df = pd.DataFrame(market_data)
-        
-        # Keep order by tickCount (already sorted in top_symbols)
-        
-        # Format display columns
-        display_df = df[[
-            "symbol", "lastPrice", "change_1h", "btc_corr", "priceChangePercent", 
-            "quoteVolume", "cg_market_cap", "cg_fdv", "circ_fdv_ratio", "ratio_spike", "tickCount", "fundingRate", "openInterest", "signals"
-        ]].copy()
-        
-        # Format numbers
-        display_df["lastPrice"] = display_df["lastPrice"].round(4)
-        display_df["change_1h"] = display_df["change_1h"].round(2)
-        display_df["btc_corr"] = display_df["btc_corr"].round(2)
-        display_df["priceChangePercent"] = display_df["priceChangePercent"].round(2)
-        display_df["quoteVolume"] = (display_df["quoteVolume"] / 1_000_000).round(1)  # Convert to millions
-        display_df["cg_market_cap"] = (display_df["cg_market_cap"] / 1_000_000_000).round(2)  # Convert to billions
-        display_df["cg_fdv"] = (display_df["cg_fdv"] / 1_000_000_000).round(2)  # Convert to billions
-        display_df["circ_fdv_ratio"] = (display_df["circ_fdv_ratio"] * 100).round(1)  # Convert to percentage
-        
-        # Format Orion data
-        display_df["tickCount"] = display_df["tickCount"].astype(int)
-        display_df["fundingRate"] = (display_df["fundingRate"] * 100).round(4)  # Convert to percentage
-        display_df["openInterest"] = (display_df["openInterest"] / 1_000_000).round(1)  # Convert to millions
-        
-        # Rename columns for display
-        display_df = display_df.rename(columns={
-            "change_1h":         "chg1h (%)",
-            "priceChangePercent": "chg24h (%)",
-            "quoteVolume":       "vol24h",
-            "cg_market_cap":     "CG MCAP (B)",
-            "cg_fdv":            "FDV (B)",
-            "circ_fdv_ratio":    "Circ/FDV (%)",
-            "ratio_spike":       "Ratio Spike",
-            "signals":           "Signal"
-        })
-        
-        # Drop the duplicate count.1 column if it exists
-        if "count.1" in display_df.columns:
-            display_df = display_df.drop(columns=["count.1"])
-        
-        return display_df, df  # Return both formatted and raw dataframes
-    
-    return pd.DataFrame(), pd.DataFrame()
+    return build_display_df(df), df  # Return both formatted and raw dataframes
+
+@st.cache_data(ttl=60)
+def build_display_df(df):
+    """
+    Scale, round, rename and downcast the market frame for the main table.
+    Cached on the frame's contents, so refreshes where nothing changed skip the transform.
+    """
+    display_df = df.loc[:, [
+        "symbol", "lastPrice", "change_1h", "btc_corr", "priceChangePercent", 
+        "quoteVolume", "cg_market_cap", "cg_fdv", "circ_fdv_ratio", "ratio_spike", "tickCount", "fundingRate", "openInterest", "signals"
+    ]]
+    
+    display_df = scale_and_round(display_df)
+    
+    # Rename columns for display
+    display_df = display_df.rename(columns={
+        "change_1h":         "chg1h (%)",
+        "priceChangePercent": "chg24h (%)",
+        "quoteVolume":       "vol24h",
+        "cg_market_cap":     "CG MCAP (B)",
+        "cg_fdv":            "FDV (B)",
+        "circ_fdv_ratio":    "Circ/FDV (%)",
+        "ratio_spike":       "Ratio Spike",
+        "signals":           "Signal"
+    })
+    
+    # Drop the duplicate count.1 column if it exists
+    if "count.1" in display_df.columns:
+        display_df = display_df.drop(columns=["count.1"])
+    
+    # Smaller Arrow payload on every rerun; the table's formats hide float32 representation noise
+    return display_df.astype(DISPLAY_DTYPES)
+
+# Seconds a session reuses its last market data while the sidebar settings are unchanged
+MARKET_DATA_TTL = 15
+
+def get_market_data_cached(symbol_limit, spike_threshold):
+    """
+    get_market_data, reused for MARKET_DATA_TTL seconds per session, so reruns from
+    unrelated widgets (tabs, chat) don't refetch. Kept in session state rather than
+    st.cache_data because get_market_data updates this session's ticks and Orion state.
+    """
+    key = (symbol_limit, spike_threshold)
+    now = time.monotonic()
+    cached = st.session_state.get("market_data_cache")
+    if cached is not None and cached[0] == key and now - cached[1] < MARKET_DATA_TTL:
+        return cached[2]
+    
+    result = get_market_data(symbol_limit, spike_threshold)
+    if not result[0].empty:
+        st.session_state.market_data_cache = (key, now, result)
+    return result
+
+# (unit multiplier, decimal places) per raw column for the tables
+DISPLAY_SCALING = {
+    "lastPrice": (1, 4),
+    "change_1h": (1, 2),
+    "btc_corr": (1, 2),
+    "priceChangePercent": (1, 2),
+    "quoteVolume": (1e-6, 1),     # millions
+    "cg_market_cap": (1e-9, 2),   # billions
+    "cg_fdv": (1e-9, 2),          # billions
+    "circ_fdv_ratio": (100, 1),   # percentage
+    "fundingRate": (100, 4),      # percentage
+    "openInterest": (1e-6, 1),    # millions
+}
+
+def scale_and_round(frame):
+    """
+    Convert DISPLAY_SCALING columns to display units and round them in one NumPy
+    pass over the stacked values. Columns the frame lacks are skipped; the frame
+    is updated in place and returned.
+    """
+    cols = [col for col in DISPLAY_SCALING if col in frame.columns]
+    if not cols:
+        return frame
+    scale, decimals = np.array([DISPLAY_SCALING[col] for col in cols], dtype=np.float64).T
+    factor = 10.0 ** decimals
+    values = frame[cols].to_numpy(dtype=np.float64) * scale
+    frame[cols] = np.rint(values * factor) / factor
+    return frame
+
+# Display-table dtypes: lastPrice stays float64 so high prices keep their 4 decimals
+DISPLAY_DTYPES = {
+    "symbol": "category",
+    "chg1h (%)": "float32",
+    "btc_corr": "float32",
+    "chg24h (%)": "float32",
+    "vol24h": "float32",
+    "CG MCAP (B)": "float32",
+    "FDV (B)": "float32",
+    "Circ/FDV (%)": "float32",
+    "Ratio Spike": "category",
+    "tickCount": "int32",
+    "fundingRate": "float32",
+    "openInterest": "float32",
+    "Signal": "category",
+}
+
+# Table styling works on whole columns via Styler.apply - one comparison per column, not a call per cell
+SPIKE_UP_STYLE = "background-color: #d4edda; color: #155724; font-weight: bold;"
+SPIKE_DOWN_STYLE = "background-color: #f8d7da; color: #721c24; font-weight: bold;"
+
+def sign_colors(col):
+    """Green text for positive values, red otherwise."""
+    return np.where(col.to_numpy() > 0, "color: green;", "color: red;")
+
+def spike_styles(col):
+    """Highlight ratio spike cells by direction; empty style for no spike."""
+    text = col.astype(str)
+    return np.select(
+        [text.str.contains("🔺", regex=False), text.str.contains("🔻", regex=False)],
+        [SPIKE_UP_STYLE, SPIKE_DOWN_STYLE],
+        default=""
+    )
 
 def main():
     # Header
@@ -448,6 +566,7 @@ def main():
     # Get symbols
     symbols = get_perpetual_symbols()
     if not symbols:
+        get_perpetual_symbols.clear()  # don't keep serving the failure to every session for an hour
         st.error("Failed to fetch symbols from Binance")
         return
     
@@ -492,11 +611,11 @@ def main():
         st.metric("📊 Symbols Available", f"{symbol_limit}/{len(symbols)}")
     
     with col3:
-        st.metric("🕒 Last Update", datetime.now().strftime("%H:%M:%S"))
+        st.metric("🕒 Last Update", time.strftime("%H:%M:%S"))
         
     with col4:
         ws_status = "🟢 Active" if st.session_state.ws_started else "🔴 Inactive"
-        tick_count = len(st.session_state.ticks)
+        tick_count = int(np.count_nonzero(st.session_state.ticks["ts"]))
         st.metric("📡 WebSocket", f"{ws_status} ({tick_count} ticks)")
         
     with col5:
@@ -506,7 +625,7 @@ def main():
     
     # Fetch market data
     with st.spinner("Fetching market data..."):
-        display_df, raw_df = get_market_data(symbol_limit, spike_threshold)
+        display_df, raw_df = get_market_data_cached(symbol_limit, spike_threshold)
     
     if display_df.empty:
         st.error("No market data available. Please check your connection.")
@@ -519,27 +638,23 @@ def main():
     with main_tab:
         st.subheader("📈 Main Market Data")
         
-        # Style: color 1H % and highlight ratio spikes
-        def highlight_spikes(val):
-            if pd.isna(val) or val is None:
-                return ""
-            if "🔺" in str(val):
-                return "background-color: #d4edda; color: #155724; font-weight: bold;"
-            elif "🔻" in str(val):
-                return "background-color: #f8d7da; color: #721c24; font-weight: bold;"
-            return ""
-        
-        styled = display_df.style.map(
-            lambda v: "color: green;" if v > 0 else "color: red;",
-            subset=["chg1h (%)"]
-        ).map(
-            highlight_spikes,
+        # Style: color 1H/24H % and highlight ratio spikes
+        styled = display_df.style.apply(
+            sign_colors,
+            subset=["chg1h (%)", "chg24h (%)"]
+        ).apply(
+            spike_styles,
             subset=["Ratio Spike"]
         ).format({
-            "BTC Corr": "{:.2f}",
+            "chg1h (%)": "{:.2f}",
+            "btc_corr": "{:.2f}",
+            "chg24h (%)": "{:.2f}",
+            "vol24h": "{:.1f}",
             "CG MCAP (B)": "{:.2f}",
             "FDV (B)": "{:.2f}",
-            "Circ/FDV (%)": "{:.1f}%"
+            "Circ/FDV (%)": "{:.1f}%",
+            "fundingRate": "{:.4f}",
+            "openInterest": "{:.1f}"
         })
         
         st.dataframe(styled, use_container_width=True, height=600)
@@ -547,11 +662,8 @@ def main():
     with signal_tab:
         st.subheader("🚨 Signal Dashboard")
         
-        # Apply compute_comprehensive_signals to each row
-        signal_results = raw_df.apply(lambda row: compute_comprehensive_signals(row), axis=1)
-        
-        # Convert list of dicts to DataFrame
-        signal_df = pd.DataFrame(list(signal_results))
+        # Comprehensive signals for every row at once, one mask per rule
+        signal_df = compute_comprehensive_signals_frame(raw_df).reset_index(drop=True)
         
         # Add a boolean column for whether any signals were detected
         signal_df["has_signal"] = signal_df["count"] > 0
@@ -573,7 +685,7 @@ def main():
             
             # Only select columns that exist
             existing_columns = [col for col in desired_columns if col in available_columns]
-            signal_display = filtered[existing_columns].copy()
+            signal_display = filtered.loc[:, existing_columns]
             
             # Apply direct DataFrame renaming
             signal_display = signal_display.rename(columns={
@@ -594,28 +706,7 @@ def main():
                 signal_display = signal_display.drop(columns=["count.1"])
             
             # Format numbers for columns that exist
-            if "lastPrice" in signal_display.columns:
-                signal_display["lastPrice"] = signal_display["lastPrice"].round(4)
-            if "change_1h" in signal_display.columns:
-                signal_display["change_1h"] = signal_display["change_1h"].round(2)
-            if "btc_corr" in signal_display.columns:
-                signal_display["btc_corr"] = signal_display["btc_corr"].round(2)
-            if "priceChangePercent" in signal_display.columns:
-                signal_display["priceChangePercent"] = signal_display["priceChangePercent"].round(2)
-            if "quoteVolume" in signal_display.columns:
-                signal_display["quoteVolume"] = (signal_display["quoteVolume"] / 1_000_000).round(1)
-            if "cg_market_cap" in signal_display.columns:
-                signal_display["cg_market_cap"] = (signal_display["cg_market_cap"] / 1_000_000_000).round(2)
-            if "cg_fdv" in signal_display.columns:
-                signal_display["cg_fdv"] = (signal_display["cg_fdv"] / 1_000_000_000).round(2)
-            if "circ_fdv_ratio" in signal_display.columns:
-                signal_display["circ_fdv_ratio"] = (signal_display["circ_fdv_ratio"] * 100).round(1)
-            if "tickCount" in signal_display.columns:
-                signal_display["tickCount"] = signal_display["tickCount"].astype(int)
-            if "fundingRate" in signal_display.columns:
-                signal_display["fundingRate"] = (signal_display["fundingRate"] * 100).round(4)
-            if "openInterest" in signal_display.columns:
-                signal_display["openInterest"] = (signal_display["openInterest"] / 1_000_000).round(1)
+            signal_display = scale_and_round(signal_display)
             
             # ✅ Deduplicate columns if needed
             def deduplicate_columns(columns):
@@ -637,17 +728,15 @@ def main():
             # Style the signal dashboard
             signal_styled = signal_display.style
             
-            # Apply color styling to 1H % if it exists
-            if "1H %" in signal_display.columns:
-                signal_styled = signal_styled.map(
-                    lambda v: "color: green;" if v > 0 else "color: red;",
-                    subset=["1H %"]
-                )
+            # Apply color styling to 1H % and 24H % where they exist
+            change_columns = [col for col in ("1H %", "24H %") if col in signal_display.columns]
+            if change_columns:
+                signal_styled = signal_styled.apply(sign_colors, subset=change_columns)
             
             # Apply spike highlighting if Ratio Spike exists
             if "Ratio Spike" in signal_display.columns:
-                signal_styled = signal_styled.map(
-                    highlight_spikes,
+                signal_styled = signal_styled.apply(
+                    spike_styles,
                     subset=["Ratio Spike"]
                 )
             
@@ -12,6 +12,9 @@ This module contains functions to detect various market signals:
 from typing import Dict, Optional, Tuple
 import logging
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -295,6 +298,78 @@ def compute_comprehensive_signals(row_data: Dict) -> Dict[str, any]:
     }
 
 
+# compute_comprehensive_signals labels in the order it appends them; the bit of each in a signal code
+COMPREHENSIVE_SIGNAL_LABELS = (
+    "🔥 Volume Spike",
+    "💥 OI Jump",
+    "💸 Funding Anomaly",
+    "📈 1H Bullish",
+    "📉 1H Bearish",
+    "⚠️ High Volatility",
+    "⚡ Tick Spike",
+    "🚀 Near High",
+    "📉 Near Low",
+)
+_COMPREHENSIVE_STRINGS = np.array([
+    ", ".join(label for bit, label in enumerate(COMPREHENSIVE_SIGNAL_LABELS) if code >> bit & 1) or "-"
+    for code in range(1 << len(COMPREHENSIVE_SIGNAL_LABELS))
+], dtype=object)
+_COMPREHENSIVE_COUNTS = np.array([
+    bin(code).count("1") for code in range(1 << len(COMPREHENSIVE_SIGNAL_LABELS))
+], dtype=np.int64)
+
+
+def compute_comprehensive_signals_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorized compute_comprehensive_signals for a whole DataFrame.
+    
+    Each rule is one boolean mask over the columns, using the same thresholds,
+    packed into a per-row bitmask. Missing columns count as 0. The per-signal
+    details are not built.
+    
+    Returns:
+        DataFrame aligned to df.index with "signal_string" and "count" columns
+    """
+    n = len(df)
+    
+    def column(key: str) -> np.ndarray:
+        return df[key].to_numpy(dtype=np.float64) if key in df.columns else np.zeros(n)
+    
+    last_price = column("lastPrice")
+    tick_price = column("last_tick_price")
+    high_price = column("highPrice")
+    low_price = column("lowPrice")
+    change_1h = column("change_1h")
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tick_spike = (last_price > 0) & (tick_price > 0) & (np.abs((last_price - tick_price) / tick_price) * 100 > 0.5)
+        has_range = (last_price > 0) & (high_price > 0) & (low_price > 0)
+        near_high = has_range & ((high_price - last_price) / high_price <= 0.01)
+        near_low = has_range & ~near_high & ((last_price - low_price) / low_price <= 0.01)
+    
+    # Bit order follows COMPREHENSIVE_SIGNAL_LABELS
+    masks = [
+        column("quoteVolume") > 500_000_000,
+        column("openInterest") > 100_000_000,
+        np.abs(column("fundingRate")) > 0.05,
+        change_1h > 3.0,
+        change_1h < -3.0,
+        np.abs(column("priceChangePercent")) > 10.0,
+        tick_spike,
+        near_high,
+        near_low,
+    ]
+    codes = np.zeros(n, dtype=np.uint16)
+    for bit, mask in enumerate(masks):
+        codes |= mask.astype(np.uint16) << bit
+    
+    # Strings and counts come from per-code tables, so no per-row string work
+    return pd.DataFrame({
+        "signal_string": _COMPREHENSIVE_STRINGS[codes],
+        "count": _COMPREHENSIVE_COUNTS[codes],
+    }, index=df.index)
+
+
 def get_signal_strength(signal_details: Dict) -> str:
     """
     Calculate the overall strength of detected signals.
@@ -36,8 +36,7 @@ def fetch_closes(symbol: str, interval: str, limit: int) -> List[float]:
         List of closing prices as floats
     """
     try:
-        klines = binance_client.get_klines(symbol, interval, limit)
-        closes = [float(candle['close']) for candle in klines]
+        closes = binance_client.get_klines_columns(symbol, interval, limit)["close"].tolist()
         logger.debug(f"Fetched {len(closes)} closing prices for {symbol} {interval}")
         return closes
     except Exception as e:
@@ -12,6 +12,25 @@ from config.settings import (
 
 logger = logging.getLogger(__name__)
 
+def _make_tier_classifier(high: float, medium: float):
+    """
+    Build a classifier for |value| with the thresholds bound as closure constants,
+    so the per-symbol path does no settings dict lookups. Returns 2 (high), 1 (medium) or 0.
+    """
+    def classify(value: float) -> int:
+        magnitude = abs(value)
+        if magnitude >= high:
+            return 2
+        if magnitude >= medium:
+            return 1
+        return 0
+    return classify
+
+# Specialised once from settings at import
+_classify_volume_ratio = _make_tier_classifier(VOLUME_SPIKE_THRESHOLD, VOLUME_SPIKE_THRESHOLD * 0.7)
+_classify_change_24h = _make_tier_classifier(PRICE_CHANGE_THRESHOLDS['24h']['high'], PRICE_CHANGE_THRESHOLDS['24h']['medium'])
+_classify_change_1h = _make_tier_classifier(PRICE_CHANGE_THRESHOLDS['1h']['high'], PRICE_CHANGE_THRESHOLDS['1h']['medium'])
+
 class SignalProcessor:
     """Processes market data to generate trading signals."""
     
@@ -65,15 +84,16 @@ class SignalProcessor:
                 hourly_klines = klines_data['1h']
                 if len(hourly_klines) >= VOLUME_LOOKBACK_PERIODS:
                     # Calculate average volume over lookback period
-                    recent_volumes = [k['quote_volume'] for k in hourly_klines[-VOLUME_LOOKBACK_PERIODS:]]
+                    recent_volumes = [k.quote_volume for k in hourly_klines[-VOLUME_LOOKBACK_PERIODS:]]
                     avg_volume = np.mean(recent_volumes)
                     
                     if avg_volume > 0:
                         volume_ratio = current_volume / avg_volume
                         
-                        if volume_ratio >= VOLUME_SPIKE_THRESHOLD:
+                        tier = _classify_volume_ratio(volume_ratio)
+                        if tier == 2:
                             signals.append(f"🔥 Volume Spike ({volume_ratio:.1f}x)")
-                        elif volume_ratio >= VOLUME_SPIKE_THRESHOLD * 0.7:
+                        elif tier == 1:
                             signals.append(f"📈 High Volume ({volume_ratio:.1f}x)")
             
             # Store baseline for future reference
@@ -92,10 +112,11 @@ class SignalProcessor:
             # 24h price change
             price_change_24h = market_data.get('price_change_percent', 0)
             
-            if abs(price_change_24h) >= PRICE_CHANGE_THRESHOLDS['24h']['high']:
+            tier = _classify_change_24h(price_change_24h)
+            if tier == 2:
                 direction = "📈" if price_change_24h > 0 else "📉"
                 signals.append(f"{direction} Major Move 24h ({price_change_24h:+.1f}%)")
-            elif abs(price_change_24h) >= PRICE_CHANGE_THRESHOLDS['24h']['medium']:
+            elif tier == 1:
                 direction = "📈" if price_change_24h > 0 else "📉"
                 signals.append(f"{direction} Strong Move 24h ({price_change_24h:+.1f}%)")
             
@@ -103,16 +124,17 @@ class SignalProcessor:
             if '1h' in klines_data and len(klines_data['1h']) >= 2:
                 recent_klines = klines_data['1h'][-2:]
                 if len(recent_klines) == 2:
-                    prev_close = recent_klines[0]['close']
-                    current_close = recent_klines[1]['close']
+                    prev_close = recent_klines[0].close
+                    current_close = recent_klines[1].close
                     
                     if prev_close > 0:
                         price_change_1h = ((current_close - prev_close) / prev_close) * 100
                         
-                        if abs(price_change_1h) >= PRICE_CHANGE_THRESHOLDS['1h']['high']:
+                        tier = _classify_change_1h(price_change_1h)
+                        if tier == 2:
                             direction = "🚀" if price_change_1h > 0 else "💥"
                             signals.append(f"{direction} Major Move 1h ({price_change_1h:+.1f}%)")
-                        elif abs(price_change_1h) >= PRICE_CHANGE_THRESHOLDS['1h']['medium']:
+                        elif tier == 1:
                             direction = "📈" if price_change_1h > 0 else "📉"
                             signals.append(f"{direction} Strong Move 1h ({price_change_1h:+.1f}%)")
             
@@ -134,10 +156,10 @@ class SignalProcessor:
                 consecutive_red = 0
                 
                 for kline in hourly_klines:
-                    if kline['close'] > kline['open']:
+                    if kline.close > kline.open:
                         consecutive_green += 1
                         consecutive_red = 0
-                    elif kline['close'] < kline['open']:
+                    elif kline.close < kline.open:
                         consecutive_red += 1
                         consecutive_green = 0
                     else:
@@ -152,7 +174,7 @@ class SignalProcessor:
                 # Check for momentum acceleration
                 if len(hourly_klines) >= 4:
                     recent_klines = hourly_klines[-4:]
-                    volumes = [k['quote_volume'] for k in recent_klines]
+                    volumes = [k.quote_volume for k in recent_klines]
                     
                     if len(volumes) >= 4:
                         # Check if volume is increasing
@@ -162,8 +184,8 @@ class SignalProcessor:
                         # Check if price movement is accelerating
                         price_changes = []
                         for i in range(1, len(recent_klines)):
-                            prev_close = recent_klines[i-1]['close']
-                            curr_close = recent_klines[i]['close']
+                            prev_close = recent_klines[i-1].close
+                            curr_close = recent_klines[i].close
                             if prev_close > 0:
                                 change = ((curr_close - prev_close) / prev_close) * 100
                                 price_changes.append(abs(change))
@@ -187,8 +209,8 @@ class SignalProcessor:
                 recent_klines = klines_data['1h'][-24:]
                 
                 # Calculate range
-                highs = [k['high'] for k in recent_klines]
-                lows = [k['low'] for k in recent_klines]
+                highs = [k.high for k in recent_klines]
+                lows = [k.low for k in recent_klines]
                 
                 range_high = max(highs)
                 range_low = min(lows)
@@ -198,7 +220,7 @@ class SignalProcessor:
                     range_size = (range_high - range_low) / range_mid
                     
                     # Check if current price is breaking out of range
-                    current_price = recent_klines[-1]['close']
+                    current_price = recent_klines[-1].close
                     
                     if current_price > range_high * (1 + RANGE_BREAK_THRESHOLD):
                         signals.append(f"🚀 Range Break Up ({range_size:.1%} range)")
@@ -8,6 +8,7 @@ with various edge cases and normal behavior scenarios.
 import pytest
 import sys
 import os
+import pandas as pd
 
 # Add the project root to the path so we can import our modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,6 +23,7 @@ from signals.basic import (
     detect_near_extremes,
     compute_basic_signals,
     compute_comprehensive_signals,
+    compute_comprehensive_signals_frame,
     get_signal_strength
 )
 
@@ -290,6 +292,25 @@ class TestComputeComprehensiveSignals:
         volume_details = result["details"]["volume_spike"]
         assert volume_details["detected"] == True
         assert volume_details["volume"] == 600_000_000
+    
+    def test_frame_matches_rows(self):
+        """Test that the vectorized variant gives the same strings and counts as per-row calls."""
+        df = pd.DataFrame({
+            "quoteVolume": [600_000_000, 1_000, 0],
+            "openInterest": [200_000_000, 0, 0],
+            "fundingRate": [0.06, -0.01, 0.0],
+            "change_1h": [-5.0, 4.0, float("nan")],
+            "lastPrice": [100.0, 10.0, 0.0],
+            "last_tick_price": [99.0, 0.0, 0.0],
+            "highPrice": [110.0, 10.05, 0.0],
+            "lowPrice": [99.5, 9.0, 0.0]
+        })
+        
+        frame = compute_comprehensive_signals_frame(df)
+        expected = [compute_comprehensive_signals(row) for row in df.to_dict("records")]
+        assert frame["signal_string"].tolist() == [e["signal_string"] for e in expected]
+        assert frame["count"].tolist() == [e["count"] for e in expected]
+        assert frame["signal_string"].iloc[2] == "-"
 
 
 class TestSignalStrength:
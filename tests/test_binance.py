@@ -0,0 +1,46 @@
+"""
+Unit tests for the BTC correlation kernel.
+
+This module tests _abs_pearson_many in clients.binance.
+"""
+
+import sys
+import os
+import numpy as np
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clients.binance import _abs_pearson_many
+
+
+def random_walk(n, seed):
+    rng = np.random.default_rng(seed)
+    return list(100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n))))
+
+
+class TestAbsPearsonMany:
+    """Test the stacked |Pearson| correlation of log returns."""
+
+    def test_matches_corrcoef(self):
+        """Test that each row matches np.corrcoef over the overlapping tail."""
+        btc = random_walk(168, 0)
+        symbols = [random_walk(168, 1), random_walk(40, 2)]
+
+        result = _abs_pearson_many(symbols, btc)
+
+        for closes, corr in zip(symbols, result):
+            n = len(closes)
+            expected = np.corrcoef(np.diff(np.log(closes)), np.diff(np.log(btc[-n:])))[0, 1]
+            assert corr == round(abs(expected), 2)
+
+    def test_scaled_btc_is_perfectly_correlated(self):
+        """Test that a constant multiple of BTC correlates at 1.0."""
+        btc = random_walk(50, 3)
+        assert _abs_pearson_many([[2 * c for c in btc]], btc) == [1.0]
+
+    def test_short_or_flat_series(self):
+        """Test that too little history or zero variance gives 0.0."""
+        btc = random_walk(50, 4)
+        assert _abs_pearson_many([[], [1.0, 2.0], [5.0] * 50], btc) == [0.0, 0.0, 0.0]
+        assert _abs_pearson_many([btc], btc[:2]) == [0.0]
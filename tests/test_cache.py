@@ -0,0 +1,295 @@
+"""
+Unit tests for the REST client caches.
+
+This module tests TTLCache, FileCache, cache_methods and the ttl_cached,
+swr_cached and single_flight decorators in clients._cache.
+"""
+
+import sys
+import os
+import time
+import asyncio
+import threading
+import gc
+import weakref
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clients._cache import TTLCache, FileCache, ttl_cached, cache_methods, swr_cached, single_flight
+
+
+class TestTTLCache:
+    """Test the in-memory TTL cache."""
+
+    def test_get_set(self):
+        """Test that a stored value is returned before it expires."""
+        cache = TTLCache(ttl=60)
+        cache.set("BTCUSDT", 1.5)
+        assert cache.get("BTCUSDT") == 1.5
+        assert len(cache) == 1
+
+    def test_missing_key(self):
+        """Test that unknown keys return the default."""
+        cache = TTLCache(ttl=60)
+        assert cache.get("ETHUSDT") is None
+        assert cache.get("ETHUSDT", 0.0) == 0.0
+
+    def test_expiry(self):
+        """Test that entries expire after the TTL."""
+        cache = TTLCache(ttl=0)
+        cache.set("BTCUSDT", 1.5)
+        assert cache.get("BTCUSDT") is None
+
+    def test_expired_entries_are_swept(self):
+        """Test that expired keys that are never read again don't accumulate."""
+        cache = TTLCache(ttl=0)
+        for i in range(1000):
+            cache.set(i, i)
+        assert len(cache) <= 64
+
+
+class TestFileCache:
+    """Test the on-disk JSON cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that values written to disk are read back."""
+        cache = FileCache(str(tmp_path), ttl=60)
+        cache.set(("klines", "BTCUSDT"), [1.0, 2.0])
+        assert cache.get(("klines", "BTCUSDT")) == [1.0, 2.0]
+
+    def test_expired_file(self, tmp_path):
+        """Test that files older than the TTL are ignored."""
+        cache = FileCache(str(tmp_path), ttl=60)
+        cache.set(("klines", "BTCUSDT"), [1.0])
+        path = cache._path(("klines", "BTCUSDT"))
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        assert cache.get(("klines", "BTCUSDT")) is None
+
+
+class TestTTLCached:
+    """Test the ttl_cached decorator."""
+
+    def test_caches_by_arguments(self):
+        """Test that repeated calls with the same arguments hit the cache."""
+        calls = []
+
+        @ttl_cached(ttl=60)
+        def fetch(symbol, limit=1):
+            calls.append((symbol, limit))
+            return len(calls)
+
+        assert fetch("BTCUSDT") == 1
+        assert fetch("BTCUSDT") == 1
+        assert fetch("ETHUSDT") == 2
+        assert fetch("BTCUSDT", limit=2) == 3
+        assert len(calls) == 3
+
+    def test_none_not_cached(self):
+        """Test that None results are retried on the next call."""
+        calls = []
+
+        @ttl_cached(ttl=60)
+        def fetch(symbol):
+            calls.append(symbol)
+            return None
+
+        fetch("BTCUSDT")
+        fetch("BTCUSDT")
+        assert len(calls) == 2
+
+    def test_coroutine_results_are_cached(self):
+        """Test that awaited results of coroutine functions are cached."""
+        calls = []
+
+        @ttl_cached(ttl=60)
+        async def fetch(symbol):
+            calls.append(symbol)
+            return symbol.lower()
+
+        async def run():
+            return [await fetch("BTCUSDT"), await fetch("BTCUSDT")]
+
+        assert asyncio.run(run()) == ["btcusdt", "btcusdt"]
+        assert len(calls) == 1
+
+    def test_disk_cache_survives_memory_clear(self, tmp_path):
+        """Test that the disk layer serves values after the memory layer is cleared."""
+        calls = []
+
+        @ttl_cached(ttl=60, disk_dir=str(tmp_path))
+        def fetch(symbol):
+            calls.append(symbol)
+            return [1.0, 2.0]
+
+        fetch("BTCUSDT")
+        fetch.cache_clear()
+        assert fetch("BTCUSDT") == [1.0, 2.0]
+        assert len(calls) == 1
+
+
+class TestCacheMethods:
+    """Test per-instance method caching."""
+
+    def test_each_instance_has_its_own_cache(self):
+        """Test that results are cached per instance and the class keeps no reference to it."""
+        class Client:
+            def __init__(self, name):
+                self.name = name
+                self.calls = 0
+                cache_methods(self, {"fetch": 60})
+
+            def fetch(self, symbol):
+                self.calls += 1
+                return f"{self.name}:{symbol}"
+
+        a, b = Client("a"), Client("b")
+        assert a.fetch("BTCUSDT") == "a:BTCUSDT"
+        assert a.fetch("BTCUSDT") == "a:BTCUSDT"
+        assert b.fetch("BTCUSDT") == "b:BTCUSDT"
+        assert (a.calls, b.calls) == (1, 1)
+
+        ref = weakref.ref(a)
+        del a
+        gc.collect()
+        assert ref() is None
+
+
+class TestSWRCached:
+    """Test the swr_cached decorator."""
+
+    def test_fresh_value_is_cached(self):
+        """Test that calls within the TTL hit the cache."""
+        calls = []
+
+        @swr_cached(ttl=60, stale=300)
+        def fetch(symbol):
+            calls.append(symbol)
+            return len(calls)
+
+        assert fetch("BTCUSDT") == 1
+        assert fetch("BTCUSDT") == 1
+        assert len(calls) == 1
+
+    def test_stale_value_is_served_while_refreshing(self):
+        """Test that a stale value is returned at once and replaced by a background refresh."""
+        calls = []
+        refreshed = threading.Event()
+
+        @swr_cached(ttl=0, stale=60)
+        def fetch(symbol):
+            calls.append(symbol)
+            if len(calls) > 1:
+                refreshed.set()
+            return len(calls)
+
+        assert fetch("BTCUSDT") == 1
+        assert fetch("BTCUSDT") == 1
+        assert refreshed.wait(1)
+        time.sleep(0.01)
+        assert fetch("BTCUSDT") >= 2
+
+    def test_expired_value_is_fetched_inline(self):
+        """Test that values older than `stale` are refetched before returning."""
+        calls = []
+
+        @swr_cached(ttl=0, stale=0)
+        def fetch(symbol):
+            calls.append(symbol)
+            return len(calls)
+
+        assert fetch("BTCUSDT") == 1
+        assert fetch("BTCUSDT") == 2
+
+    def test_failed_refresh_keeps_old_value(self):
+        """Test that a refresh returning None or raising leaves the cached value in place."""
+        results = iter([1, None])
+        refreshed = threading.Event()
+
+        @swr_cached(ttl=0, stale=60)
+        def fetch(symbol):
+            value = next(results, "boom")
+            if value is None:
+                refreshed.set()
+            if value == "boom":
+                raise RuntimeError(value)
+            return value
+
+        assert fetch("BTCUSDT") == 1
+        assert fetch("BTCUSDT") == 1
+        assert refreshed.wait(1)
+        time.sleep(0.01)
+        assert fetch("BTCUSDT") == 1
+        time.sleep(0.01)
+        assert fetch("BTCUSDT") == 1
+
+    def test_failed_inline_fetch_returns_old_value(self):
+        """Test that an expired value is still returned when its inline refetch fails."""
+        results = iter([1, None])
+
+        @swr_cached(ttl=0, stale=0)
+        def fetch(symbol):
+            return next(results)
+
+        assert fetch("BTCUSDT") == 1
+        assert fetch("BTCUSDT") == 1
+
+
+class TestSingleFlight:
+    """Test the single_flight decorator."""
+
+    def test_async_calls_are_coalesced(self):
+        """Test that concurrent coroutine calls with the same key share one call."""
+        calls = []
+
+        @single_flight
+        async def fetch(symbol):
+            calls.append(symbol)
+            await asyncio.sleep(0.01)
+            return symbol.lower()
+
+        async def run():
+            return await asyncio.gather(fetch("BTCUSDT"), fetch("BTCUSDT"), fetch("ETHUSDT"))
+
+        assert asyncio.run(run()) == ["btcusdt", "btcusdt", "ethusdt"]
+        assert calls == ["BTCUSDT", "ETHUSDT"]
+
+    def test_threaded_calls_are_coalesced(self):
+        """Test that concurrent calls from threads share the first thread's result."""
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        @single_flight
+        def fetch(symbol):
+            calls.append(symbol)
+            started.set()
+            release.wait(1)
+            return len(calls)
+
+        results = []
+        first = threading.Thread(target=lambda: results.append(fetch("BTCUSDT")))
+        first.start()
+        started.wait(1)
+        second = threading.Thread(target=lambda: results.append(fetch("BTCUSDT")))
+        second.start()
+        time.sleep(0.05)
+        release.set()
+        first.join()
+        second.join()
+
+        assert results == [1, 1]
+        assert len(calls) == 1
+
+    def test_sequential_calls_are_not_cached(self):
+        """Test that a finished call is not reused by the next one."""
+        calls = []
+
+        @single_flight
+        def fetch(symbol):
+            calls.append(symbol)
+            return len(calls)
+
+        assert fetch("BTCUSDT") == 1
+        assert fetch("BTCUSDT") == 2
@@ -0,0 +1,73 @@
+"""
+Unit tests for the asyncio helpers.
+
+This module tests drain_queue and the background loop in utils.helpers.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.helpers import drain_queue, run_async, get_background_loop, submit_background
+
+
+class TestDrainQueue:
+    """Test batched queue draining."""
+
+    def test_takes_everything_queued(self):
+        """Test that one call returns all pending items in order."""
+        async def run():
+            queue = asyncio.Queue()
+            for i in range(5):
+                queue.put_nowait(i)
+            return await drain_queue(queue), queue.qsize()
+
+        assert run_async(run()) == ([0, 1, 2, 3, 4], 0)
+
+    def test_respects_max_batch(self):
+        """Test that items beyond max_batch stay queued."""
+        async def run():
+            queue = asyncio.Queue()
+            for i in range(5):
+                queue.put_nowait(i)
+            return await drain_queue(queue, max_batch=2), queue.qsize()
+
+        assert run_async(run()) == ([0, 1], 3)
+
+    def test_waits_for_first_item(self):
+        """Test that an empty queue blocks until an item arrives."""
+        async def run():
+            queue = asyncio.Queue()
+            asyncio.get_running_loop().call_later(0.01, queue.put_nowait, "tick")
+            return await drain_queue(queue)
+
+        assert run_async(run()) == ["tick"]
+
+
+class TestBackgroundLoop:
+    """Test the shared background event loop."""
+
+    def test_loop_is_shared(self):
+        """Test that every caller gets the same running loop."""
+        loop = get_background_loop()
+        assert get_background_loop() is loop
+        assert submit_background(asyncio.sleep(0, "ok")).result(timeout=1) == "ok"
+        assert loop.is_running()
+
+    def test_spawned_tasks_outlive_the_coroutine(self):
+        """Test that tasks created by a submitted coroutine keep running after it returns."""
+        async def spawn():
+            async def later():
+                await asyncio.sleep(0.01)
+                return "done"
+            return asyncio.create_task(later())
+
+        task = submit_background(spawn()).result(timeout=1)
+
+        async def wait():
+            return await task
+
+        assert submit_background(wait()).result(timeout=1) == "done"
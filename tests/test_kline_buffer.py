@@ -0,0 +1,60 @@
+"""
+Unit tests for the kline ring buffer.
+
+This module tests KlineRingBuffer in data.kline_buffer.
+"""
+
+import sys
+import os
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clients.binance_client import Kline
+from data.kline_buffer import KlineRingBuffer
+
+
+def make_kline(ts, close):
+    return Kline(ts, close, close, close, close, 1.0, ts + 59_999, close, 1, 0.5, close / 2)
+
+
+class TestKlineRingBuffer:
+    """Test KlineRingBuffer."""
+
+    def test_append_and_read(self):
+        """Test that appended klines come back oldest first with attribute access."""
+        buffer = KlineRingBuffer(capacity=5)
+        for i in range(3):
+            buffer.upsert(make_kline(i * 60_000, 100.0 + i))
+
+        assert len(buffer) == 3
+        assert [k.close for k in buffer] == [100.0, 101.0, 102.0]
+        assert buffer[-1].close == 102.0
+
+    def test_same_timestamp_overwrites(self):
+        """Test that an update to the open candle replaces it instead of appending."""
+        buffer = KlineRingBuffer(capacity=5)
+        buffer.upsert(make_kline(0, 100.0))
+        buffer.upsert(make_kline(0, 105.0))
+
+        assert len(buffer) == 1
+        assert buffer[-1].close == 105.0
+
+    def test_wraps_at_capacity(self):
+        """Test that the oldest klines are dropped once the buffer is full."""
+        buffer = KlineRingBuffer(capacity=3)
+        for i in range(5):
+            buffer.upsert(make_kline(i * 60_000, float(i)))
+
+        assert len(buffer) == 3
+        assert [k.close for k in buffer[-3:]] == [2.0, 3.0, 4.0]
+        assert list(buffer.to_dataframe()["close"]) == [2.0, 3.0, 4.0]
+
+    def test_load_then_stream(self):
+        """Test that REST history and streamed updates share one buffer."""
+        buffer = KlineRingBuffer(capacity=3)
+        buffer.load([make_kline(i * 60_000, float(i)) for i in range(4)])
+        buffer.upsert(make_kline(3 * 60_000, 30.0))
+        buffer.upsert(make_kline(4 * 60_000, 40.0))
+
+        assert [k.close for k in buffer] == [2.0, 30.0, 40.0]
@@ -0,0 +1,53 @@
+"""
+Unit tests for the Binance request-weight limiter.
+
+This module tests WeightLimiter and klines_weight in clients._ratelimit.
+"""
+
+import sys
+import os
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clients._ratelimit import WeightLimiter, klines_weight, USED_WEIGHT_HEADER
+
+
+class TestKlinesWeight:
+    """Test the klines weight table."""
+
+    def test_weight_tiers(self):
+        """Test that weight grows with the requested limit."""
+        assert klines_weight(2) == 1
+        assert klines_weight(168) == 2
+        assert klines_weight(500) == 5
+        assert klines_weight(1440) == 10
+
+
+class TestWeightLimiter:
+    """Test the per-minute weight budget."""
+
+    def test_reserve_within_budget(self):
+        """Test that requests inside the budget go through immediately."""
+        limiter = WeightLimiter(limit=100, headroom=1.0)
+        assert limiter._reserve(60) == 0.0
+        assert limiter._reserve(40) == 0.0
+
+    def test_reserve_over_budget_waits(self):
+        """Test that a request past the budget is told to wait for the next minute."""
+        limiter = WeightLimiter(limit=100, headroom=1.0)
+        limiter._reserve(90)
+        wait = limiter._reserve(20)
+        assert 0 < wait <= 60
+
+    def test_header_raises_local_count(self):
+        """Test that the server's used-weight header is adopted when higher."""
+        limiter = WeightLimiter(limit=100, headroom=1.0)
+        limiter.update({USED_WEIGHT_HEADER: "95"})
+        assert limiter._reserve(10) > 0
+
+    def test_rate_limited_response_blocks(self):
+        """Test that a 429 with Retry-After blocks further requests."""
+        limiter = WeightLimiter(limit=100)
+        limiter.update({"Retry-After": "30"}, status=429)
+        assert 29 <= limiter._reserve(1) <= 30
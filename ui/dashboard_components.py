@@ -5,6 +5,15 @@ import plotly.express as px
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import numpy as np
+import re
+
+# Emoji markers each signal filter checkbox matches in a row's Signals string
+SIGNAL_FILTER_MARKERS = {
+    "volume": ("🔥",),
+    "momentum": ("🟢", "🔴"),
+    "breakout": ("🚀", "💥"),
+    "price": ("📈", "📉"),
+}
 
 def create_header():
     """Create the main dashboard header."""
@@ -198,24 +207,17 @@ def create_main_data_table(market_data: Dict[str, Dict], signals: Dict[str, List
     # Apply filters
     filtered_df = df.copy()
     
-    # Apply signal filters
+    # Apply signal filters - one scan of the Signals column for all enabled markers
     if not all(controls["signal_filters"].values()):
-        mask = pd.Series([False] * len(filtered_df))
-        for i, row in filtered_df.iterrows():
-            signals_str = row["Signals"]
-            has_valid_signal = False
-            
-            if controls["signal_filters"]["volume"] and "🔥" in signals_str:
-                has_valid_signal = True
-            if controls["signal_filters"]["momentum"] and ("🟢" in signals_str or "🔴" in signals_str):
-                has_valid_signal = True
-            if controls["signal_filters"]["breakout"] and ("🚀" in signals_str or "💥" in signals_str):
-                has_valid_signal = True
-            if controls["signal_filters"]["price"] and ("📈" in signals_str or "📉" in signals_str):
-                has_valid_signal = True
-            
-            mask[i] = has_valid_signal
-        
+        markers = [
+            marker
+            for name, enabled in controls["signal_filters"].items() if enabled
+            for marker in SIGNAL_FILTER_MARKERS.get(name, ())
+        ]
+        if markers:
+            mask = filtered_df["Signals"].str.contains("|".join(map(re.escape, markers)))
+        else:
+            mask = np.zeros(len(filtered_df), dtype=bool)
         filtered_df = filtered_df[mask]
     
     # Apply sorting
@@ -232,7 +234,8 @@ def create_main_data_table(market_data: Dict[str, Dict], signals: Dict[str, List
     
     if sort_column == "Signals":
         # Sort by number of signals
-        filtered_df["Signal Count"] = filtered_df["Signals"].apply(lambda x: len(x.split(", ")) if x else 0)
+        signals_str = filtered_df["Signals"]
+        filtered_df["Signal Count"] = (signals_str.str.count(", ") + 1).where(signals_str != "", 0)
         filtered_df = filtered_df.sort_values("Signal Count", ascending=ascending)
     else:
         filtered_df = filtered_df.sort_values(sort_column, ascending=ascending)
@@ -321,13 +324,15 @@ def create_performance_metrics(market_data: Dict[str, Dict]):
     
     st.subheader("📊 Performance Metrics")
     
-    # Calculate metrics
+    # Calculate metrics - each field is pulled out of the dicts once
     total_volume = sum(data.get("quote_volume", 0) for data in market_data.values())
-    avg_change_24h = np.mean([data.get("price_change_percent", 0) for data in market_data.values()])
+    pct = np.fromiter((data.get("price_change_percent", 0) for data in market_data.values()),
+                      dtype=float, count=len(market_data))
+    avg_change_24h = pct.mean()
     
     # Count gainers vs losers
-    gainers = sum(1 for data in market_data.values() if data.get("price_change_percent", 0) > 0)
-    losers = sum(1 for data in market_data.values() if data.get("price_change_percent", 0) < 0)
+    gainers = int((pct > 0).sum())
+    losers = int((pct < 0).sum())
     
     col1, col2, col3, col4 = st.columns(4)
     
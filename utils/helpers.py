@@ -1,11 +1,68 @@
+import asyncio
+import concurrent.futures
 import logging
+import sys
+import threading
 import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import pandas as pd
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and not available on Windows
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# Process-wide loop for long-running collectors, started on first use
+_BACKGROUND_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BACKGROUND_LOOP_LOCK = threading.Lock()
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop's libuv-based loop when it is installed."""
+    if uvloop is not None and sys.platform != 'win32':
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+def run_async(coro) -> Any:
+    """Run a coroutine to completion on a fresh loop from new_event_loop(), like asyncio.run()."""
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop running forever on a daemon thread, starting it if needed."""
+    global _BACKGROUND_LOOP
+    with _BACKGROUND_LOOP_LOCK:
+        if _BACKGROUND_LOOP is None:
+            loop = new_event_loop()
+            threading.Thread(target=loop.run_forever, name="background-loop", daemon=True).start()
+            _BACKGROUND_LOOP = loop
+        return _BACKGROUND_LOOP
+
+def submit_background(coro) -> concurrent.futures.Future:
+    """Schedule a coroutine on the background loop from any thread; tasks it spawns keep running."""
+    return asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+
+async def drain_queue(queue: asyncio.Queue, max_batch: int = 512) -> List[Any]:
+    """Wait for one item, then take whatever else is already queued, up to max_batch items."""
+    items = [await queue.get()]
+    get_nowait = queue.get_nowait
+    for _ in range(max_batch - 1):
+        try:
+            items.append(get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return items
+
 def format_number(value: float, decimals: int = 2, prefix: str = "", suffix: str = "") -> str:
     """Format a number with appropriate suffixes (K, M, B)."""
     if value is None or value == 0: